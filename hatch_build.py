@@ -0,0 +1,94 @@
+"""Hatch build hook that pre-compiles the QSS themes into a Python module.
+
+At wheel build time the bundled .qss files are read, stripped of comments
+and blank lines, and written to ``get_gphotos_data/core/_themes.py`` as a
+``THEMES`` dict. At runtime ``core.paths.qss_text`` returns the frozen
+string instead of reading the asset through importlib.resources.
+
+The generated module only exists inside built wheels; source checkouts
+keep reading the .qss files directly, so edits to them are never shadowed
+by a stale generated file.
+
+Wheels also ship bytecode for the build interpreter, so the first launch
+after installing with a tool that does not compile on install (e.g. uv
+without --compile-bytecode) does not pay for compiling every module. The
+.pyc files use unchecked-hash invalidation: installed sources never change,
+and installers set file mtimes that would defeat timestamp validation.
+"""
+
+from __future__ import annotations
+
+import py_compile
+import re
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from hatchling.builders.hooks.plugin.interface import BuildHookInterface
+
+# Theme name -> stylesheet file in src/get_gphotos_data/assets
+_THEME_FILES = {"light": "styles.qss", "dark": "styles_dark.qss"}
+_COMMENT_RE = re.compile(r"/\*.*?\*/", re.DOTALL)
+
+
+def minify_qss(text: str) -> str:
+    """Strip /* */ comments, surrounding whitespace and blank lines from QSS."""
+    text = _COMMENT_RE.sub("", text)
+    return "\n".join(line.strip() for line in text.splitlines() if line.strip())
+
+
+class CustomBuildHook(BuildHookInterface):
+    """Generate core/_themes.py and package bytecode, and force-include them in the wheel."""
+
+    def initialize(self, version: str, build_data: dict[str, Any]) -> None:
+        self._tmp_dir = tempfile.mkdtemp(prefix="get_gphotos_data_build_")
+        if version == "editable":
+            return
+        generated = self._generate_themes()
+        build_data["force_include"][str(generated)] = "get_gphotos_data/core/_themes.py"
+        self._compile_bytecode(build_data, {generated: "get_gphotos_data/core/_themes.py"})
+
+    def _generate_themes(self) -> Path:
+        """Write the minified THEMES module into the build temp directory."""
+        assets = Path(self.root) / "src" / "get_gphotos_data" / "assets"
+        themes = {
+            name: minify_qss((assets / filename).read_text(encoding="utf-8"))
+            for name, filename in _THEME_FILES.items()
+        }
+        lines = [
+            '"""Pre-compiled QSS themes (generated by hatch_build.py - do not edit)."""',
+            "",
+            "THEMES: dict[str, str] = {",
+            *(f"    {name!r}: {qss!r}," for name, qss in themes.items()),
+            "}",
+            "",
+        ]
+        generated = Path(self._tmp_dir) / "_themes.py"
+        generated.write_text("\n".join(lines), encoding="utf-8")
+        return generated
+
+    def _compile_bytecode(self, build_data: dict[str, Any], extra: dict[Path, str]) -> None:
+        """Compile every package module and force-include the .pyc files."""
+        src = Path(self.root) / "src"
+        modules = {
+            py: py.relative_to(src).as_posix() for py in (src / "get_gphotos_data").rglob("*.py")
+        }
+        modules.update(extra)
+        tag = sys.implementation.cache_tag
+        for py, rel in modules.items():
+            parent, _, filename = rel.rpartition("/")
+            target = f"{parent}/__pycache__/{filename[:-3]}.{tag}.pyc"
+            cfile = Path(self._tmp_dir) / "pyc" / target
+            py_compile.compile(
+                str(py),
+                cfile=str(cfile),
+                dfile=rel,
+                doraise=True,
+                invalidation_mode=py_compile.PycInvalidationMode.UNCHECKED_HASH,
+            )
+            build_data["force_include"][str(cfile)] = target
+
+    def finalize(self, version: str, build_data: dict[str, Any], artifact_path: str) -> None:
+        shutil.rmtree(self._tmp_dir, ignore_errors=True)
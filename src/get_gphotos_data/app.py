@@ -3,7 +3,7 @@
 This module provides the main application startup logic, including:
 - QApplication creation and configuration
 - Single-instance guard to prevent multiple instances
-- Logging and exception handling setup
+- Logging and (deferred) exception handling setup
 - Theme and icon loading
 - Main window creation and event loop execution
 """
@@ -12,17 +12,15 @@ from __future__ import annotations
 
 import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QIcon, QPixmap
-from PySide6.QtWidgets import QApplication
+from PySide6.QtCore import QCoreApplication, Qt, QThread, QTimer
 
 from .core.exceptions import install_exception_hook
 from .core.logging_setup import setup_logging
-from .core.paths import APP_NAME, APP_ORG, app_icon_bytes, app_version, qss_text
-from .core.settings import Settings
-from .core.single_instance import SingleInstanceGuard
-from .main_window import MainWindow
+from .core.paths import APP_NAME, APP_ORG, app_data_dir, app_version, qss_text
+from .core.settings import Settings, read_snapshot
+from .core.single_instance import SingleInstanceGuard, acquire_lock
 
 
 def run(splash_screen_seconds: int | None = None, force_no_splash: bool = False) -> int:
@@ -35,37 +33,51 @@ def run(splash_screen_seconds: int | None = None, force_no_splash: bool = False)
     - Creates and shows the main window
     - Starts the Qt event loop
 
+    QtWidgets, QtGui and the main window are imported only after the
+    single-instance check, so a duplicate launch exits without loading them.
+
     Returns:
         Exit code from the application event loop (typically 0 for normal exit).
     """
-    app = QApplication(sys.argv)
-    app.setApplicationName(APP_NAME)
-    app.setOrganizationName(APP_ORG)
-    app.setAttribute(Qt.ApplicationAttribute.AA_UseHighDpiPixmaps, True)
+    # Application metadata is static, so QSettings can resolve its storage
+    # location before any QApplication exists.
+    QCoreApplication.setApplicationName(APP_NAME)
+    QCoreApplication.setOrganizationName(APP_ORG)
+
+    # Read every setting on a worker thread while the main thread takes the
+    # single-instance lock and imports the UI modules; Settings then starts
+    # with a warm cache instead of reading QSettings key by key.
+    guard = SingleInstanceGuard()
+    # Qt adopts the first thread that touches its thread data as the main
+    # thread; claim it here before the worker creates a QSettings.
+    QThread.currentThread()
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        snapshot = pool.submit(read_snapshot)
+        # Single instance guard: an OS file lock decides ownership before Qt is
+        # initialized, so a duplicate launch never pays for QApplication startup.
+        is_primary = acquire_lock(app_data_dir() / f"{guard.app_id}.lock") is not None
+        if is_primary:
+            from PySide6.QtWidgets import QApplication
+
+            from .core.icon_cache import get_app_icon
+            from .main_window import MainWindow
+        settings = Settings(snapshot=snapshot.result())
 
-    # Load settings early to check debug flag
-    settings = Settings()
     debug_api = settings.get_debug_api()
-
     setup_logging(enable_console=debug_api)
-    # Install exception hook with explicit dialog factory to avoid circular dependency
-    # This allows core/exceptions to not import dialogs at module level
-    from .dialogs.error_dialog import ErrorDialog
-
-    def create_error_dialog(exc_type, exc, tb, log_path, parent):
-        return ErrorDialog(exc_type, exc, tb, log_path, parent)
-
-    install_exception_hook(error_dialog_factory=create_error_dialog)
     log = logging.getLogger(__name__)
 
-    # Single instance guard
-    guard = SingleInstanceGuard()
-    if guard.is_another_instance_running():
+    if not is_primary:
         # Try to send activate message to existing instance
-        guard.send_message_to_existing_instance()
+        if guard.is_another_instance_running():
+            guard.send_message_to_existing_instance()
         log.info("Another instance detected, exiting")
         return 0
 
+    app = QApplication(sys.argv)
+    app.setAttribute(Qt.ApplicationAttribute.AA_UseHighDpiPixmaps, True)
+    guard.start_server()
+
     # Load packaged assets via importlib.resources so this works from wheels.
     # Apply theme from settings
     theme = settings.get_theme()
@@ -74,16 +86,9 @@ def run(splash_screen_seconds: int | None = None, force_no_splash: bool = False)
     except FileNotFoundError:
         log.warning("QSS stylesheet not found in package assets for theme: %s", theme)
 
-    try:
-        icon_bytes = app_icon_bytes()
-    except FileNotFoundError:
-        log.warning("App icon not found in package assets.")
-    else:
-        pixmap = QPixmap()
-        if pixmap.loadFromData(icon_bytes):
-            app.setWindowIcon(QIcon(pixmap))
-        else:
-            log.warning("App icon data could not be decoded.")
+    icon = get_app_icon()
+    if not icon.isNull():
+        app.setWindowIcon(icon)
 
     win = MainWindow(settings=settings, instance_guard=guard)
 
@@ -102,6 +107,8 @@ def run(splash_screen_seconds: int | None = None, force_no_splash: bool = False)
 
     guard.set_new_connection_callback(handle_new_instance)
 
+    win.show()
+
     # Determine splash screen duration:
     # - If force_no_splash is True, explicitly don't show (override settings)
     # - If splash_screen_seconds is explicitly provided, use that (command-line override)
@@ -111,23 +118,39 @@ def run(splash_screen_seconds: int | None = None, force_no_splash: bool = False)
     elif splash_screen_seconds is None:
         splash_screen_seconds = settings.get_splash_screen_seconds()
 
-    # Show splash screen if requested
+    # Show splash screen if requested, once the main window has painted. The
+    # about dialog module is only imported when a splash is actually shown.
     # If splash_screen_seconds is 0, show but wait for user to click OK (no auto-close)
     # If splash_screen_seconds > 0, show and auto-close after that many seconds
     if splash_screen_seconds is not None:
-        from .dialogs.about import AboutDialog
-
         auto_close = splash_screen_seconds if splash_screen_seconds > 0 else None
-        splash = AboutDialog(
-            version=app_version(),
-            release_notes_url="",
-            auto_close_seconds=auto_close,
-            parent=None,
-        )
-        splash.show()
-        app.processEvents()  # Process events to show splash immediately
-        # Use exec() which blocks until dialog closes (either by timer or user clicking OK)
-        splash.exec()
 
-    win.show()
+        def _show_splash() -> None:
+            from .dialogs.about import AboutDialog
+
+            splash = AboutDialog(
+                version=app_version(),
+                release_notes_url="",
+                auto_close_seconds=auto_close,
+                parent=None,
+            )
+            # exec() blocks until dialog closes (either by timer or user clicking OK)
+            splash.exec()
+
+        QTimer.singleShot(0, _show_splash)
+
+    # Install the exception hook on the first event-loop tick so the dialog
+    # module import stays off the critical path to the first painted frame.
+    # Until then Python's default hook reports errors on stderr.
+    def _install_hook_lazy() -> None:
+        # Explicit dialog factory avoids a circular dependency: core/exceptions
+        # does not import dialogs at module level
+        from .dialogs.error_dialog import ErrorDialog
+
+        def create_error_dialog(exc_type, exc, tb, log_path, parent):
+            return ErrorDialog(exc_type, exc, tb, log_path, parent)
+
+        install_exception_hook(error_dialog_factory=create_error_dialog)
+
+    QTimer.singleShot(0, _install_hook_lazy)
     return app.exec()
@@ -16,11 +16,13 @@ import contextlib
 import logging
 import sys
 import traceback
-
-from PySide6.QtWidgets import QApplication, QWidget
+from typing import TYPE_CHECKING
 
 from .paths import app_data_dir
 
+if TYPE_CHECKING:
+    from PySide6.QtWidgets import QWidget
+
 
 def install_exception_hook(
     error_dialog_factory=None,
@@ -41,6 +43,9 @@ def install_exception_hook(
         log.exception("Unhandled exception:\n%s", details)
 
         with contextlib.suppress(Exception):
+            # QtWidgets is imported lazily so installing the hook stays cheap
+            from PySide6.QtWidgets import QApplication
+
             # Only show dialog if QApplication exists
             app = QApplication.instance()
             if not app:
@@ -10,14 +10,54 @@ Separated from MainWindow to improve modularity and testability.
 
 from __future__ import annotations
 
+import contextlib
+import itertools
+import os
 from pathlib import Path
 
 from .settings import Settings
 
+# scandir stops after this many entries per candidate name and stats the
+# rest, so a few recent files in a large directory do not list all of it
+_SCAN_ENTRIES_PER_NAME = 16
+
+
+def _existing_files(paths: list[str]) -> set[str]:
+    """Return the subset of paths that are regular files.
+
+    Paths are grouped by parent directory. A directory holding several
+    candidates is listed with os.scandir instead of stat'ing each file, for
+    at most _SCAN_ENTRIES_PER_NAME entries per candidate. Names are compared
+    with os.path.normcase; any candidate the listing did not match (a lone
+    candidate, an unreadable or large directory, a case-only difference on a
+    case-insensitive filesystem) falls back to os.path.isfile.
+    """
+    groups: dict[str, dict[str, list[str]]] = {}
+    for path in paths:
+        parent, name = os.path.split(path)
+        groups.setdefault(parent, {}).setdefault(os.path.normcase(name), []).append(path)
+
+    existing: set[str] = set()
+    for parent, pending in groups.items():
+        if len(pending) > 1:
+            budget = _SCAN_ENTRIES_PER_NAME * len(pending)
+            with contextlib.suppress(OSError), os.scandir(parent or os.curdir) as entries:
+                for entry in itertools.islice(entries, budget):
+                    matched = pending.pop(os.path.normcase(entry.name), None)
+                    if matched and entry.is_file():
+                        existing.update(matched)
+                    if not pending:
+                        break
+        for candidates in pending.values():
+            existing.update(path for path in candidates if os.path.isfile(path))
+    return existing
+
 
 class FileManager:
     """Manages file operations and recent files list."""
 
+    __slots__ = ("_max_recent_files", "settings")
+
     def __init__(self, settings: Settings, max_recent_files: int | None = None) -> None:
         """Initialize file manager.
 
@@ -45,24 +85,23 @@ class FileManager:
         Returns:
             List of valid recent file paths
         """
-        recent: list[Path] = []
+        stored: list[str] = []
         seen: set[str] = set()
         raw = self.settings.get_recent_files()
-        # Process each item, removing duplicates and invalid files
-        for item in raw:
-            path = Path(item).expanduser()
-            if not path.is_file():
-                continue
-            key = str(path)
-            if key in seen:
+        # Process each item, removing duplicates and invalid files. Work on
+        # plain strings and only build Path objects for the surviving entries;
+        # normpath merges spellings like a//b.txt and a/b.txt as Path() did.
+        expanded_items = [os.path.normpath(os.path.expanduser(item)) for item in raw]
+        existing = _existing_files(expanded_items)
+        for expanded in expanded_items:
+            if expanded in seen or expanded not in existing:
                 continue
-            recent.append(path)
-            seen.add(key)
+            stored.append(expanded)
+            seen.add(expanded)
         # Update settings if we removed any invalid entries
-        stored = [str(path) for path in recent]
-        if stored != raw:
+        if raw and stored != raw:
             self.settings.set_recent_files(stored)
-        return recent
+        return [Path(item) for item in stored]
 
     def add_recent_file(self, path: Path) -> None:
         """Add a file to the recent files list, moving it to the top.
@@ -71,15 +110,15 @@ class FileManager:
             path: Path to the file to remember
         """
         path_str = str(path)
-        # Put current file at the top
-        recent = [path_str]
-        # Add existing recent files, excluding the current one
-        for item in self.settings.get_recent_files():
-            if item != path_str:
-                recent.append(item)
-        # Limit to max and save (always use current setting value)
-        max_files = self.settings.get_max_recent_files()
-        self.settings.set_recent_files(recent[:max_files])
+        current = self.settings.get_recent_files()
+        # Put current file at the top, followed by the others (excluding it)
+        recent = [path_str, *(item for item in current if item != path_str)]
+        # Limit to max (always use current setting value)
+        recent = recent[: self.settings.get_max_recent_files()]
+        # Reopening the most recent file leaves the list unchanged - skip the write
+        if recent == current:
+            return
+        self.settings.set_recent_files(recent)
 
     def clear_recent_files(self) -> None:
         """Clear all recent files from the list."""
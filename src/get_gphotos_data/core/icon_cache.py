@@ -0,0 +1,54 @@
+"""Application icon cache.
+
+This module decodes the bundled app icon once per process and keeps a
+QIcon with pre-scaled pixmaps for the sizes the application actually uses
+(window title bar, system tray, about dialog). Callers share the cached
+icon instead of decoding the PNG again.
+
+A QGuiApplication must exist before get_app_icon() is first called.
+"""
+
+from __future__ import annotations
+
+import functools
+import logging
+
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QIcon, QPixmap
+
+from .paths import app_icon_bytes
+
+# Pixel sizes pre-rendered into the cached icon
+_ICON_SIZES = (16, 22, 32, 64, 128)
+
+
+@functools.lru_cache(maxsize=1)
+def get_app_icon() -> QIcon:
+    """Return the application icon, decoding the packaged PNG on first use.
+
+    Returns:
+        The cached QIcon, or a null QIcon if the asset is missing or invalid.
+    """
+    log = logging.getLogger(__name__)
+    icon = QIcon()
+    try:
+        icon_bytes = app_icon_bytes()
+    except FileNotFoundError:
+        log.warning("App icon not found in package assets.")
+        return icon
+
+    pixmap = QPixmap()
+    if not pixmap.loadFromData(icon_bytes):
+        log.warning("App icon data could not be decoded.")
+        return icon
+
+    for size in _ICON_SIZES:
+        icon.addPixmap(
+            pixmap.scaled(
+                size,
+                size,
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.SmoothTransformation,
+            )
+        )
+    return icon
@@ -8,15 +8,59 @@ rotated to prevent unbounded growth:
 - Encoding: UTF-8
 
 The log file is located at: {app_data_dir}/app.log
+
+Records are handed to a QueueHandler on the calling thread and written by a
+background QueueListener, so logging from the UI thread never blocks on disk
+I/O or file rotation. The listener is flushed and stopped at interpreter exit.
 """
 
 from __future__ import annotations
 
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+import time
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 from .paths import app_data_dir
 
+# The log format does not use thread/process fields, so skip collecting them
+# in every LogRecord (avoids threading.current_thread() and os.getpid() calls).
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
+# Background listener writing queued records; replaced on each setup_logging call
+_listener: QueueListener | None = None
+
+
+class _SecondCachedFormatter(logging.Formatter):
+    """Formatter that renders each second's timestamp only once.
+
+    The date format has one-second resolution, so bursts of records within
+    the same second reuse the previous strftime result.
+    """
+
+    _last_second = -1
+    _last_text = ""
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:
+        second = int(record.created)
+        if second != self._last_second:
+            self._last_text = time.strftime(
+                datefmt or self.datefmt or self.default_time_format, self.converter(second)
+            )
+            self._last_second = second
+        return self._last_text
+
+
+def _stop_listener() -> None:
+    """Flush pending records and stop the background listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
 
 def setup_logging(enable_console: bool = False) -> None:
     """Configure rotating file logging in the per-user data directory.
@@ -35,24 +79,35 @@ def setup_logging(enable_console: bool = False) -> None:
         backupCount=3,
         encoding="utf-8",
     )
-    fmt = logging.Formatter(
-        fmt="%(asctime)s %(levelname)s %(name)s - %(message)s",
+    fmt = _SecondCachedFormatter(
+        fmt="{asctime} {levelname} {name} - {message}",
         datefmt="%Y-%m-%d %H:%M:%S",
+        style="{",
     )
     file_handler.setFormatter(fmt)
-
-    root = logging.getLogger()
-    root.setLevel(logging.INFO)
-    # Ensure we do not duplicate logs if setup_logging is called twice.
-    root.handlers.clear()
-    root.addHandler(file_handler)
+    handlers: list[logging.Handler] = [file_handler]
 
     # Add console handler if debug logging is enabled
     if enable_console:
         console_handler = logging.StreamHandler()
         console_handler.setFormatter(fmt)
-        root.addHandler(console_handler)
+        handlers.append(console_handler)
+
+    global _listener
+    _stop_listener()
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    # Ensure we do not duplicate logs if setup_logging is called twice.
+    root.handlers.clear()
+    root.addHandler(QueueHandler(log_queue))
 
     logging.getLogger(__name__).info(
         "Logging initialized: %s (console: %s)", log_file, enable_console
     )
+
+
+atexit.register(_stop_listener)
@@ -114,7 +114,19 @@ def app_executable_dir() -> Path:
 
 
 def qss_text(theme: str = "light") -> str:
-    """Return the bundled QSS stylesheet as text for the given theme."""
+    """Return the bundled QSS stylesheet as text for the given theme.
+
+    Built wheels ship the themes pre-compiled in core/_themes.py (generated by
+    hatch_build.py), making this a dict lookup. Source checkouts fall back to
+    reading the .qss asset.
+    """
+    theme = "dark" if theme == "dark" else "light"
+    try:
+        from ._themes import THEMES  # type: ignore[import-not-found]
+    except ImportError:
+        pass
+    else:
+        return THEMES[theme]
     filename = "styles_dark.qss" if theme == "dark" else "styles.qss"
     return (files("get_gphotos_data") / _ASSETS_DIR / filename).read_text(encoding="utf-8")
 
@@ -8,55 +8,96 @@ registered via setuptools entry points. Plugins can:
 
 Plugins are discovered from the 'get_gphotos_data.plugins' entry point group.
 Each plugin can implement hook methods and command registration.
+
+Discovery only reads entry point metadata; a plugin's module is imported the
+first time it is needed (get_plugin, call_hook, register_commands).
 """
 
 from __future__ import annotations
 
+import functools
 import logging
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from typing import Any
 
 try:
-    from importlib.metadata import entry_points
+    from importlib.metadata import EntryPoint, entry_points
 except ImportError:
-    from importlib_metadata import entry_points  # type: ignore[no-redef]
+    from importlib_metadata import EntryPoint, entry_points  # type: ignore[no-redef]
+
+
+@functools.cache
+def _eps_for(group: str) -> tuple[EntryPoint, ...]:
+    """Return the entry points in a group, parsing distribution metadata once per process."""
+    return tuple(entry_points(group=group))
 
 
 class PluginManager:
     """Manages plugins loaded via entry points."""
 
+    __slots__ = ("_entry_points", "_failed", "_loaded", "entry_point_group", "log")
+
     def __init__(self, entry_point_group: str = "get_gphotos_data.plugins") -> None:
         self.log = logging.getLogger(__name__)
         self.entry_point_group = entry_point_group
-        self.plugins: dict[str, Any] = {}
+        self._entry_points: dict[str, EntryPoint] = {}
+        self._loaded: dict[str, Any] = {}
+        self._failed: set[str] = set()
         self._load_plugins()
 
     def _load_plugins(self) -> None:
-        """Load all plugins registered via entry points."""
+        """Discover plugins registered via entry points without importing them."""
         try:
-            eps = entry_points(group=self.entry_point_group)
+            eps = _eps_for(self.entry_point_group)
             for ep in eps:
-                try:
-                    plugin = ep.load()
-                    self.plugins[ep.name] = plugin
-                    self.log.info("Loaded plugin: %s", ep.name)
-                except Exception as e:
-                    self.log.error("Failed to load plugin %s: %s", ep.name, e)
+                self._entry_points[ep.name] = ep
+                self.log.debug("Discovered plugin: %s", ep.name)
         except Exception as e:
             self.log.debug("No plugins found or error loading plugins: %s", e)
 
+    def _resolve(self, name: str) -> Any | None:
+        """Import a plugin on first access.
+
+        Returns:
+            The loaded plugin, or None if it is unknown or failed to load.
+        """
+        if name in self._loaded:
+            return self._loaded[name]
+        ep = self._entry_points.get(name)
+        if ep is None or name in self._failed:
+            return None
+        try:
+            plugin = ep.load()
+        except Exception as e:
+            self._failed.add(name)
+            self.log.error("Failed to load plugin %s: %s", name, e)
+            return None
+        self._loaded[name] = plugin
+        self.log.info("Loaded plugin: %s", name)
+        return plugin
+
+    def _iter_plugins(self) -> Iterator[tuple[str, Any]]:
+        """Yield (name, plugin) for every plugin that loads successfully."""
+        for name in self._entry_points:
+            plugin = self._resolve(name)
+            if plugin is not None:
+                yield name, plugin
+
     def get_plugin(self, name: str) -> Any | None:
         """Get a plugin by name."""
-        return self.plugins.get(name)
+        return self._resolve(name)
 
     def get_all_plugins(self) -> dict[str, Any]:
-        """Get all loaded plugins."""
-        return self.plugins.copy()
+        """Get all plugins, loading any that have not been imported yet."""
+        return dict(self._iter_plugins())
 
     def call_hook(self, hook_name: str, *args: Any, **kwargs: Any) -> list[Any]:
         """
         Call a hook on all plugins that support it.
 
+        Plugins are imported on first use, since whether a plugin implements a
+        hook cannot be known from entry point metadata alone.
+
         Args:
             hook_name: Name of the hook method to call
             *args: Positional arguments to pass to the hook
@@ -66,7 +107,7 @@ class PluginManager:
             List of return values from plugin hooks (None values are filtered out)
         """
         results = []
-        for name, plugin in self.plugins.items():
+        for name, plugin in self._iter_plugins():
             hook = getattr(plugin, hook_name, None)
             if hook and callable(hook):
                 try:
@@ -86,7 +127,7 @@ class PluginManager:
         Args:
             command_registry: Function to register a command (name, description, shortcut, action)
         """
-        for name, plugin in self.plugins.items():
+        for name, plugin in self._iter_plugins():
             if hasattr(plugin, "register_commands"):
                 try:
                     plugin.register_commands(command_registry)
@@ -8,16 +8,60 @@ Settings are automatically persisted to platform-appropriate locations:
 - macOS: ~/Library/Preferences/
 - Windows: Registry
 - Linux: ~/.config/
-"""
-
-from __future__ import annotations
 
-from dataclasses import dataclass
+Raw values are cached in-process after the first read, so repeated getter
+calls do not go back to QSettings (which may re-parse the backing store),
+and setters skip the write when the value is unchanged.
 
-from PySide6.QtCore import QSettings
+On shutdown the cache is also written as JSON to {app_data_dir}/settings.json,
+tagged with the modification time and size of the QSettings backing file.
+At the next startup read_snapshot() loads that snapshot instead of parsing
+the native store, as long as the backing file is unchanged. Binary values
+(window geometry/state) are stored base64-encoded. A snapshot that cannot
+be read back is deleted and QSettings is used instead.
+"""
 
+from __future__ import annotations
 
-@dataclass(frozen=True)
+import base64
+import contextlib
+import functools
+import json
+import os
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass, fields
+from pathlib import Path
+from typing import Any
+
+from PySide6.QtCore import QByteArray, QCoreApplication, QSettings, QTimer
+
+from .paths import app_data_dir
+
+_SNAPSHOT_FILE = "settings.json"
+# Pickled snapshot written by earlier versions; removed on the next save
+_LEGACY_SNAPSHOT_FILE = "settings.pkl"
+# JSON object keys marking base64-encoded binary values, by the type to restore
+_BYTES_TAG = "__bytes__"
+_QBYTEARRAY_TAG = "__qbytearray__"
+_VALID_THEMES: frozenset[str] = frozenset(("light", "dark"))
+
+
+@functools.lru_cache(maxsize=64)
+def _is_dir(path_str: str, _epoch_second: int) -> bool:
+    """Return whether path_str is a directory.
+
+    The second argument is the current whole second of time.monotonic(), so a
+    cached result is reused for at most one second before the path is stat'ed
+    again.
+    """
+    try:
+        return Path(path_str).expanduser().is_dir()
+    except (OSError, ValueError):
+        return False
+
+
+@dataclass(frozen=True, slots=True)
 class SettingsKeys:
     """Centralize QSettings keys used by the application."""
 
@@ -31,26 +75,176 @@ class SettingsKeys:
     debug_api: str = "debug/api_logging"
 
 
+def _all_keys() -> list[str]:
+    """Return every QSettings key declared on SettingsKeys."""
+    return [f.default for f in fields(SettingsKeys)]
+
+
+def _file_stamp(path: str) -> tuple[int, int] | None:
+    """Return (mtime_ns, size) for path, or None if it is not a readable file."""
+    try:
+        st = os.stat(path)
+    except (OSError, ValueError):
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _to_json(value: Any) -> Any:
+    """Return value in its JSON snapshot form.
+
+    Raises:
+        TypeError: If value is not a type the snapshot can store.
+    """
+    if value is None or isinstance(value, str | bool | int | float):
+        return value
+    if isinstance(value, bytes):
+        return {_BYTES_TAG: base64.b64encode(value).decode("ascii")}
+    if isinstance(value, QByteArray):
+        return {_QBYTEARRAY_TAG: base64.b64encode(value.data()).decode("ascii")}
+    if isinstance(value, list | tuple) and all(isinstance(v, str) for v in value):
+        return list(value)
+    raise TypeError(f"cannot snapshot {type(value).__name__}")
+
+
+def _from_json(obj: dict[str, Any]) -> Any:
+    """json object_hook that turns tagged objects back into bytes or QByteArray."""
+    if obj.keys() == {_BYTES_TAG}:
+        return base64.b64decode(obj[_BYTES_TAG], validate=True)
+    if obj.keys() == {_QBYTEARRAY_TAG}:
+        return QByteArray(base64.b64decode(obj[_QBYTEARRAY_TAG], validate=True))
+    return obj
+
+
+def _load_json_snapshot() -> dict[str, Any] | None:
+    """Return the snapshot values if they still match the QSettings backing file.
+
+    A snapshot that cannot be parsed is deleted, so a damaged file costs one
+    QSettings read instead of failing every startup.
+    """
+    path = app_data_dir() / _SNAPSHOT_FILE
+    try:
+        raw = path.read_bytes()
+    except OSError:
+        return None
+    try:
+        data = json.loads(raw, object_hook=_from_json)
+        values = data["values"]
+        if not isinstance(data["source"], str) or not isinstance(values, dict):
+            raise TypeError("malformed settings snapshot")
+        for value in values.values():
+            if not isinstance(value, bytes | QByteArray):
+                _to_json(value)  # TypeError for anything save_snapshot() never writes
+        stamp = _file_stamp(data["source"])
+        if stamp is None or list(stamp) != data["stamp"]:
+            return None
+        known = set(_all_keys())
+        return {key: value for key, value in values.items() if key in known}
+    except Exception:
+        with contextlib.suppress(OSError):
+            path.unlink(missing_ok=True)
+        return None
+
+
+def read_snapshot() -> dict[str, Any]:
+    """Read the raw value of every known setting key.
+
+    Prefers the JSON snapshot written by Settings.save_snapshot() and
+    falls back to a QSettings instance of its own, so it can run on a worker
+    thread while the main thread continues with startup. The result can be
+    passed to Settings(snapshot=...) to pre-populate its cache.
+    """
+    cached = _load_json_snapshot()
+    if cached is not None:
+        return cached
+    qs = QSettings()
+    return {key: qs.value(key) for key in _all_keys()}
+
+
 class Settings:
     """Wrapper around QSettings with convenience getters/setters."""
 
-    def __init__(self) -> None:
-        self._qs = QSettings()
+    __slots__ = ("_batch_depth", "_cache", "_dirty", "_qs_instance", "keys")
+
+    def __init__(self, snapshot: dict[str, Any] | None = None) -> None:
+        """Initialize settings.
+
+        Args:
+            snapshot: Raw values from read_snapshot() used to pre-populate the
+                cache; keys it does not contain are read lazily.
+        """
         self.keys = SettingsKeys()
+        self._qs_instance: QSettings | None = None
+        self._batch_depth = 0
+        self._dirty = False
+        # Raw QSettings values keyed by setting name (None = not set)
+        self._cache: dict[str, Any] = dict(snapshot) if snapshot else {}
+
+    @property
+    def _qs(self) -> QSettings:
+        """Backing QSettings, created on first cache miss or write."""
+        if self._qs_instance is None:
+            self._qs_instance = QSettings()
+        return self._qs_instance
+
+    def _value(self, key: str) -> Any:
+        """Return the raw stored value for key, reading QSettings only on a cache miss."""
+        try:
+            return self._cache[key]
+        except KeyError:
+            value = self._qs.value(key)
+            self._cache[key] = value
+            return value
+
+    def _set_value(self, key: str, value: Any) -> None:
+        """Write a value to QSettings and keep the cache in step.
+
+        Writing the value that is already cached is a no-op.
+        """
+        if key in self._cache and self._cache[key] == value:
+            return
+        self._qs.setValue(key, value)
+        self._cache[key] = value
+        self._dirty = True
+
+    @contextlib.contextmanager
+    def batch(self, defer_sync: bool = False) -> Iterator[None]:
+        """Group several writes and flush them to the backing store once.
+
+        Without a batch QSettings flushes on its own schedule; inside one,
+        the writes are synced together when the outermost batch exits.
+
+        Args:
+            defer_sync: If True and an event loop is available, run the sync on
+                the next event-loop iteration instead of blocking the caller
+                (e.g. so a dialog can close first).
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._dirty:
+                self._dirty = False
+                if defer_sync and QCoreApplication.instance() is not None:
+                    QTimer.singleShot(0, self._qs.sync)
+                else:
+                    self._qs.sync()
+
+    def invalidate(self) -> None:
+        """Drop all cached values so the next reads go back to QSettings."""
+        self._cache.clear()
 
     def get_str(self, key: str, default: str = "") -> str:
-        value = self._qs.value(key, defaultValue=default)
+        value = self._value(key)
         return str(value) if value is not None else default
 
     def set_str(self, key: str, value: str) -> None:
-        self._qs.setValue(key, value)
+        self._set_value(key, value)
 
     def get_str_list(self, key: str, default: list[str] | None = None) -> list[str]:
-        if default is None:
-            default = []
-        value = self._qs.value(key, defaultValue=default)
+        value = self._value(key)
         if value is None:
-            return list(default)
+            return list(default) if default else []
         if isinstance(value, (list, tuple)):
             return [str(item) for item in value]
         if isinstance(value, str):
@@ -58,7 +252,7 @@ class Settings:
         return [str(value)]
 
     def set_str_list(self, key: str, values: list[str]) -> None:
-        self._qs.setValue(key, list(values))
+        self._set_value(key, list(values))
 
     def get_recent_files(self) -> list[str]:
         return self.get_str_list(self.keys.recent_files, [])
@@ -74,7 +268,7 @@ class Settings:
 
     def get_window_geometry(self) -> bytes | None:
         """Get saved window geometry as bytes, or None if not set."""
-        value = self._qs.value(self.keys.window_geometry)
+        value = self._value(self.keys.window_geometry)
         if value is None:
             return None
         if isinstance(value, bytes):
@@ -88,11 +282,11 @@ class Settings:
 
     def set_window_geometry(self, geometry: bytes) -> None:
         """Save window geometry as bytes."""
-        self._qs.setValue(self.keys.window_geometry, geometry)
+        self._set_value(self.keys.window_geometry, geometry)
 
     def get_window_state(self) -> bytes | None:
         """Get saved window state as bytes, or None if not set."""
-        value = self._qs.value(self.keys.window_state)
+        value = self._value(self.keys.window_state)
         if value is None:
             return None
         if isinstance(value, bytes):
@@ -106,27 +300,53 @@ class Settings:
 
     def set_window_state(self, state: bytes) -> None:
         """Save window state (toolbars, docks, etc.) as bytes."""
-        self._qs.setValue(self.keys.window_state, state)
+        self._set_value(self.keys.window_state, state)
 
     def reset_to_defaults(self) -> None:
         """Reset all settings to their default values."""
         self._qs.clear()
+        self.invalidate()
+        self._dirty = True
+
+    def save_snapshot(self) -> None:
+        """Write all settings as JSON for read_snapshot() to use at the next startup.
+
+        Skipped when QSettings has no backing file to validate the snapshot
+        against (e.g. the Windows registry). Values of types the snapshot
+        cannot store are left out and read from QSettings on demand.
+        """
+        self._qs.sync()
+        source = self._qs.fileName()
+        stamp = _file_stamp(source)
+        if stamp is None:
+            return
+        values: dict[str, Any] = {}
+        for key in _all_keys():
+            with contextlib.suppress(TypeError):
+                values[key] = _to_json(self._value(key))
+        data = {"source": source, "stamp": list(stamp), "values": values}
+        path = app_data_dir() / _SNAPSHOT_FILE
+        tmp = path.with_suffix(".tmp")
+        # Best effort: runs from closeEvent, so no failure may escape
+        with contextlib.suppress(OSError):
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp.write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
+                os.replace(tmp, path)
+            finally:
+                # Only still present if the replace did not happen
+                tmp.unlink(missing_ok=True)
+            (path.parent / _LEGACY_SNAPSHOT_FILE).unlink(missing_ok=True)
 
     def validate_last_open_dir(self, path_str: str) -> bool:
         """Validate that last_open_dir is a valid directory path."""
         if not path_str:
             return True  # Empty is valid (will use home directory)
-        from pathlib import Path
-
-        try:
-            path = Path(path_str).expanduser()
-            return path.is_dir()
-        except (OSError, ValueError):
-            return False
+        return _is_dir(path_str, int(time.monotonic()))
 
     def validate_theme(self, theme: str) -> bool:
         """Validate that theme is one of the supported themes."""
-        return theme in ("light", "dark")
+        return theme in _VALID_THEMES
 
     def get_splash_screen_seconds(self) -> int | None:
         """Get splash screen display duration in seconds.
@@ -135,7 +355,7 @@ class Settings:
             Number of seconds to show splash screen (0 = show until user clicks OK),
             or None to not show it (default).
         """
-        value = self._qs.value(self.keys.splash_screen_seconds)
+        value = self._value(self.keys.splash_screen_seconds)
         if value is None:
             return None
         try:
@@ -151,9 +371,13 @@ class Settings:
                     or None to not show it (removes the setting).
         """
         if seconds is None:
+            if self._value(self.keys.splash_screen_seconds) is None:
+                return
             self._qs.remove(self.keys.splash_screen_seconds)
+            self._cache[self.keys.splash_screen_seconds] = None
+            self._dirty = True
         else:
-            self._qs.setValue(self.keys.splash_screen_seconds, seconds)
+            self._set_value(self.keys.splash_screen_seconds, seconds)
 
     def get_max_recent_files(self) -> int:
         """Get maximum number of recent files to remember.
@@ -161,7 +385,7 @@ class Settings:
         Returns:
             Maximum number of recent files (default: 10).
         """
-        value = self._qs.value(self.keys.max_recent_files)
+        value = self._value(self.keys.max_recent_files)
         if value is None:
             return 10  # Default value
         try:
@@ -179,7 +403,7 @@ class Settings:
         """
         # Ensure reasonable bounds
         clamped = max(1, min(100, max_files))
-        self._qs.setValue(self.keys.max_recent_files, clamped)
+        self._set_value(self.keys.max_recent_files, clamped)
 
     def get_debug_api(self) -> bool:
         """Get API debug logging setting.
@@ -187,7 +411,7 @@ class Settings:
         Returns:
             True if API debug logging is enabled (default: True).
         """
-        value = self._qs.value(self.keys.debug_api)
+        value = self._value(self.keys.debug_api)
         if value is None:
             return True  # Default to enabled
         if isinstance(value, bool):
@@ -203,4 +427,4 @@ class Settings:
         Args:
             enabled: Whether to enable API debug logging.
         """
-        self._qs.setValue(self.keys.debug_api, enabled)
+        self._set_value(self.keys.debug_api, enabled)
@@ -1,11 +1,12 @@
 """Single-instance application guard.
 
 This module provides functionality to ensure only one instance of the
-application runs at a time. It uses QLocalServer/QLocalSocket for
-inter-process communication.
+application runs at a time. Ownership is decided by an exclusive OS file
+lock (taken before Qt is initialized), and QLocalServer/QLocalSocket are
+used for inter-process communication.
 
 When a second instance is launched:
-- The new instance detects the existing instance via socket connection
+- The new instance fails to take the lock and connects to the existing instance
 - Sends an "activate" message to bring the existing window to front
 - Exits immediately
 
@@ -16,6 +17,7 @@ the window when a new instance attempts to start.
 from __future__ import annotations
 
 import logging
+import os
 import sys
 from pathlib import Path
 
@@ -24,12 +26,45 @@ from PySide6.QtNetwork import QLocalServer, QLocalSocket
 from .paths import APP_NAME
 
 
+def acquire_lock(path: Path) -> int | None:
+    """Take an exclusive, non-blocking lock on a pidfile.
+
+    Uses fcntl.flock on POSIX and msvcrt.locking on Windows. The lock is
+    released by the OS when the process exits, so stale lock files are harmless.
+
+    Args:
+        path: Lock file location (parent directories are created if needed)
+
+    Returns:
+        The open file descriptor holding the lock, or None if another
+        process already holds it.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+    try:
+        if sys.platform == "win32":
+            import msvcrt
+
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        os.close(fd)
+        return None
+    os.ftruncate(fd, 0)
+    os.write(fd, str(os.getpid()).encode("ascii"))
+    return fd
+
+
 class SingleInstanceGuard:
     """Ensures only one instance of the application is running."""
 
     def __init__(self, app_id: str | None = None) -> None:
         self.log = logging.getLogger(__name__)
         self.app_id = app_id or APP_NAME.replace(" ", "-").lower()
+        self.socket_name = f"{self.app_id}-single-instance"
         self.server: QLocalServer | None = None
         self.socket: QLocalSocket | None = None
         self._is_running = False
@@ -38,27 +73,31 @@ class SingleInstanceGuard:
         """
         Check if another instance is already running.
 
+        This only probes for an existing server, so it is safe to call before
+        a QApplication exists. Call start_server() afterwards (once the Qt
+        event loop is available) to listen for later instances.
+
         Returns:
             True if another instance is running, False otherwise.
         """
         self.socket = QLocalSocket()
-        socket_name = f"{self.app_id}-single-instance"
-
-        self.socket.connectToServer(socket_name, QLocalSocket.OpenModeFlag.ReadWrite)
+        self.socket.connectToServer(self.socket_name, QLocalSocket.OpenModeFlag.ReadWrite)
 
         if self.socket.waitForConnected(500):
-            # Another instance is running
+            # Another instance is running; keep the socket open so
+            # send_message_to_existing_instance() can use it
             self.log.info("Another instance is already running")
-            self.socket.disconnectFromServer()
-            self.socket = None
             return True
 
-        # No other instance, create server
-        self._create_server(socket_name)
         return False
 
-    def _create_server(self, socket_name: str) -> None:
-        """Create a local server to listen for other instances."""
+    def start_server(self) -> None:
+        """Create a local server to listen for other instances.
+
+        Requires a QCoreApplication instance so the server's socket notifier
+        is attached to the main thread's event dispatcher.
+        """
+        socket_name = self.socket_name
         self.server = QLocalServer()
 
         # Remove existing server if it exists (Qt's recommended way to clean up stale sockets)
@@ -100,7 +139,10 @@ class SingleInstanceGuard:
             return False
 
         self.socket.write(message)
-        return self.socket.waitForBytesWritten(1000)
+        sent = self.socket.waitForBytesWritten(1000)
+        self.socket.disconnectFromServer()
+        self.socket = None
+        return sent
 
     def set_new_connection_callback(self, callback) -> None:
         """Set callback to handle messages from new instances."""
@@ -16,10 +16,11 @@ import logging
 from collections.abc import Callable
 
 from PySide6.QtCore import QObject, Signal
-from PySide6.QtGui import QAction, QIcon, QPixmap
+from PySide6.QtGui import QAction
 from PySide6.QtWidgets import QMenu, QSystemTrayIcon
 
-from .paths import app_icon_bytes
+from .icon_cache import get_app_icon
+from .paths import APP_NAME
 
 
 class SystemTray(QObject):
@@ -41,18 +42,14 @@ class SystemTray(QObject):
 
         self.tray_icon = QSystemTrayIcon(self)
 
-        # Set icon
-        try:
-            icon_bytes = app_icon_bytes()
-            pixmap = QPixmap()
-            if pixmap.loadFromData(icon_bytes):
-                self.tray_icon.setIcon(QIcon(pixmap))
-        except Exception as e:
-            self.log.warning("Failed to load tray icon: %s", e)
+        # Set icon (shared, pre-scaled app icon)
+        icon = get_app_icon()
+        if icon.isNull():
+            self.log.warning("Failed to load tray icon")
+        else:
+            self.tray_icon.setIcon(icon)
 
         # Set tooltip
-        from .paths import APP_NAME
-
         self.tray_icon.setToolTip(APP_NAME)
 
         # Connect activation signal
@@ -6,24 +6,39 @@ both from source and when installed from wheels.
 
 The loader reads .ui files as bytes from the package and uses QUiLoader
 to instantiate the widget hierarchy without requiring code generation.
+The bytes are cached after the first read, so building the same UI again
+(e.g. reopening a dialog) does not go back to the filesystem. A single
+QUiLoader is shared by all loads: constructing one scans the Qt plugin
+paths for custom widget plugins, which costs more than many small forms
+take to build.
 """
 
 from __future__ import annotations
 
+import functools
+from collections.abc import Mapping
 from importlib.resources import files
+from typing import Any
 
-from PySide6.QtCore import QBuffer, QIODevice
+from PySide6.QtCore import QBuffer, QIODevice, QObject
 from PySide6.QtUiTools import QUiLoader
 from PySide6.QtWidgets import QWidget
 
 _UI_DIR = "ui"  # Subdirectory within assets containing .ui files
 
 
+@functools.lru_cache(maxsize=32)
 def ui_bytes(filename: str) -> bytes:
     """Return raw bytes for a packaged Qt Designer .ui file."""
     return (files("get_gphotos_data") / "assets" / _UI_DIR / filename).read_bytes()
 
 
+@functools.lru_cache(maxsize=1)
+def _loader() -> QUiLoader:
+    """Return the process-wide QUiLoader (GUI thread only)."""
+    return QUiLoader()
+
+
 def load_ui(filename: str, parent: QWidget | None = None) -> QWidget:
     """Load a Qt Designer .ui file into a QWidget using QUiLoader."""
     data = ui_bytes(filename)
@@ -31,10 +46,39 @@ def load_ui(filename: str, parent: QWidget | None = None) -> QWidget:
     buffer.setData(data)
     buffer.open(QIODevice.OpenModeFlag.ReadOnly)
     try:
-        loader = QUiLoader()
-        widget = loader.load(buffer, parent)
+        widget = _loader().load(buffer, parent)
     finally:
         buffer.close()
     if widget is None:
         raise RuntimeError(f"Failed to load UI file: {filename}")
     return widget
+
+
+def named_children(
+    root: QObject, required: Mapping[str, type[QObject]], ui_file: str
+) -> dict[str, Any]:
+    """Index the named descendants of a loaded .ui widget in one tree walk.
+
+    This replaces a series of findChild() calls, each of which walks the
+    whole widget tree again.
+
+    Args:
+        root: Widget returned by load_ui()
+        required: Object names that must exist, mapped to their expected class
+        ui_file: .ui file name, used in error messages
+
+    Returns:
+        Mapping of objectName to child object for every named descendant.
+
+    Raises:
+        RuntimeError: If a required child is missing or has the wrong type.
+    """
+    children: dict[str, Any] = {}
+    for child in root.findChildren(QObject):
+        name = child.objectName()
+        if name:
+            children.setdefault(name, child)
+    for name, cls in required.items():
+        if not isinstance(children.get(name), cls):
+            raise RuntimeError(f"{name} not found in {ui_file}")
+    return children
@@ -17,11 +17,19 @@ importlib.metadata.version() or can be passed directly.
 from __future__ import annotations
 
 from PySide6.QtCore import QSize, Qt, QTimer
-from PySide6.QtGui import QIcon, QPixmap
 from PySide6.QtWidgets import QDialog, QLabel, QPushButton, QVBoxLayout
 
-from ..core.paths import APP_NAME, app_icon_bytes
-from ..core.ui_loader import load_ui
+from ..core.icon_cache import get_app_icon
+from ..core.paths import APP_NAME
+from ..core.ui_loader import load_ui, named_children
+
+# Widgets about_dialog.ui must provide; releaseNotesLabel is optional
+_REQUIRED_WIDGETS = {
+    "iconLabel": QLabel,
+    "nameLabel": QLabel,
+    "versionLabel": QLabel,
+    "okButton": QPushButton,
+}
 
 
 class AboutDialog(QDialog):
@@ -62,35 +70,22 @@ class AboutDialog(QDialog):
         main_layout = QVBoxLayout(self)
         main_layout.addWidget(self._ui)
 
-        # Find widgets from UI file
-        icon_label = self._ui.findChild(QLabel, "iconLabel")
-        name_label = self._ui.findChild(QLabel, "nameLabel")
-        version_label = self._ui.findChild(QLabel, "versionLabel")
-        release_notes_label = self._ui.findChild(QLabel, "releaseNotesLabel")
-        ok_button = self._ui.findChild(QPushButton, "okButton")
-
-        if icon_label is None or name_label is None or version_label is None:
-            raise RuntimeError("Required widgets not found in about_dialog.ui")
-        if ok_button is None:
-            raise RuntimeError("okButton not found in about_dialog.ui")
-
-        # App icon - load and set pixmap
-        try:
-            icon_bytes = app_icon_bytes()
-            pixmap = QPixmap()
-            if pixmap.loadFromData(icon_bytes):
-                # Set window icon
-                self.setWindowIcon(QIcon(pixmap))
-                # Scale icon to reasonable size for display
-                scaled_pixmap = pixmap.scaled(
-                    QSize(64, 64),
-                    Qt.AspectRatioMode.KeepAspectRatio,
-                    Qt.TransformationMode.SmoothTransformation,
-                )
-                icon_label.setPixmap(scaled_pixmap)
-        except Exception:
+        # Index widgets from UI file in a single tree walk
+        widgets = named_children(self._ui, _REQUIRED_WIDGETS, "about_dialog.ui")
+        icon_label = widgets["iconLabel"]
+        name_label = widgets["nameLabel"]
+        version_label = widgets["versionLabel"]
+        ok_button = widgets["okButton"]
+        release_notes_label = widgets.get("releaseNotesLabel")
+
+        # App icon - uses the shared icon, which already holds a 64px rendition
+        icon = get_app_icon()
+        if icon.isNull():
             # If icon loading fails, hide the icon label
             icon_label.setVisible(False)
+        else:
+            self.setWindowIcon(icon)
+            icon_label.setPixmap(icon.pixmap(QSize(64, 64)))
 
         # App name
         name_label.setText(f"<h2>{APP_NAME}</h2>")
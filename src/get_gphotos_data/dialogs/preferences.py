@@ -14,7 +14,7 @@ when the theme changes so the application can update immediately.
 
 from __future__ import annotations
 
-from PySide6.QtCore import Signal
+from PySide6.QtCore import Qt, Signal
 from PySide6.QtWidgets import (
     QCheckBox,
     QComboBox,
@@ -22,6 +22,7 @@ from PySide6.QtWidgets import (
     QDialogButtonBox,
     QLabel,
     QLineEdit,
+    QMessageBox,
     QPushButton,
     QSpinBox,
     QVBoxLayout,
@@ -29,7 +30,20 @@ from PySide6.QtWidgets import (
 )
 
 from ..core.settings import Settings
-from ..core.ui_loader import load_ui
+from ..core.ui_loader import load_ui, named_children
+
+# Widgets preferences_dialog.ui must provide, with their expected types
+_REQUIRED_WIDGETS = {
+    "lastDirLineEdit": QLineEdit,
+    "themeComboBox": QComboBox,
+    "splashEnabledCheckBox": QCheckBox,
+    "splashSecondsSpinBox": QSpinBox,
+    "splashSecondsLabel": QLabel,
+    "maxRecentFilesSpinBox": QSpinBox,
+    "clearRecentFilesButton": QPushButton,
+    "resetToDefaultsButton": QPushButton,
+    "buttonBox": QDialogButtonBox,
+}
 
 
 class PreferencesDialog(QDialog):
@@ -41,6 +55,7 @@ class PreferencesDialog(QDialog):
         super().__init__(parent)
         self.setWindowTitle("Preferences")
         self._settings = settings
+        self._built = False
         self._ui: QWidget
         self.button_box: QDialogButtonBox
         self.theme_combo: QComboBox
@@ -49,78 +64,91 @@ class PreferencesDialog(QDialog):
         self.splash_seconds_spin: QSpinBox
         self.max_recent_files_spin: QSpinBox
         self.clear_recent_files_btn: QPushButton
-
+        self._splash_seconds_label: QLabel
+        # Widget values as last loaded from settings, used to detect edits
+        self._initial_values: dict[str, object] = {}
+
+    def setVisible(self, visible: bool) -> None:  # type: ignore[override]
+        """Build the UI on first show and reload values from settings on every show.
+
+        The .ui file is loaded here rather than in __init__ (and before the base
+        class sizes the dialog), so constructing the dialog stays cheap and a
+        reused instance never shows stale edits from a cancelled session.
+        """
+        if visible:
+            if not self._built:
+                self._build_ui()
+            self._reload_values()
+        super().setVisible(visible)
+
+    def _build_ui(self) -> None:
+        """Load the .ui file, look up child widgets and wire signals."""
+        self._built = True
         self._ui = load_ui("preferences_dialog.ui", self)
         main_layout = QVBoxLayout(self)
         main_layout.addWidget(self._ui)
 
         # Find all widgets from the UI file
-        last_dir = self._ui.findChild(QLineEdit, "lastDirLineEdit")
-        if last_dir is None:
-            raise RuntimeError("lastDirLineEdit not found in preferences_dialog.ui")
-        self.last_dir = last_dir
-        self.last_dir.setText(self._settings.get_str(self._settings.keys.last_open_dir, ""))
+        widgets = named_children(self._ui, _REQUIRED_WIDGETS, "preferences_dialog.ui")
+        self.last_dir = widgets["lastDirLineEdit"]
 
-        theme_combo = self._ui.findChild(QComboBox, "themeComboBox")
-        if theme_combo is None:
-            raise RuntimeError("themeComboBox not found in preferences_dialog.ui")
-        self.theme_combo = theme_combo
+        self.theme_combo = widgets["themeComboBox"]
         self.theme_combo.addItems(["light", "dark"])
-        self.theme_combo.setCurrentText(self._settings.get_theme())
 
-        splash_enabled_check = self._ui.findChild(QCheckBox, "splashEnabledCheckBox")
-        if splash_enabled_check is None:
-            raise RuntimeError("splashEnabledCheckBox not found in preferences_dialog.ui")
-        self.splash_enabled_check = splash_enabled_check
-        splash_seconds = self._settings.get_splash_screen_seconds()
-        self.splash_enabled_check.setChecked(splash_seconds is not None)
+        self.splash_enabled_check = widgets["splashEnabledCheckBox"]
+        self.splash_seconds_spin = widgets["splashSecondsSpinBox"]
+        self._splash_seconds_label = widgets["splashSecondsLabel"]
 
-        splash_seconds_spin = self._ui.findChild(QSpinBox, "splashSecondsSpinBox")
-        if splash_seconds_spin is None:
-            raise RuntimeError("splashSecondsSpinBox not found in preferences_dialog.ui")
-        self.splash_seconds_spin = splash_seconds_spin
-        # Set value: if None or 0, set to 0 (until OK), otherwise use the value
-        splash_value = splash_seconds if splash_seconds is not None and splash_seconds > 0 else 0
-        self.splash_seconds_spin.setValue(splash_value)
+        # Enable/disable spinbox and label based on checkbox
+        self.splash_enabled_check.toggled.connect(
+            self.splash_seconds_spin.setEnabled, Qt.ConnectionType.DirectConnection
+        )
+        self.splash_enabled_check.toggled.connect(
+            self._splash_seconds_label.setEnabled, Qt.ConnectionType.DirectConnection
+        )
 
-        splash_seconds_label = self._ui.findChild(QLabel, "splashSecondsLabel")
-        if splash_seconds_label is None:
-            raise RuntimeError("splashSecondsLabel not found in preferences_dialog.ui")
+        self.max_recent_files_spin = widgets["maxRecentFilesSpinBox"]
 
-        # Enable/disable spinbox and label based on checkbox
-        self.splash_seconds_spin.setEnabled(self.splash_enabled_check.isChecked())
-        splash_seconds_label.setEnabled(self.splash_enabled_check.isChecked())
-        self.splash_enabled_check.toggled.connect(self.splash_seconds_spin.setEnabled)
-        self.splash_enabled_check.toggled.connect(splash_seconds_label.setEnabled)
-
-        max_recent_files_spin = self._ui.findChild(QSpinBox, "maxRecentFilesSpinBox")
-        if max_recent_files_spin is None:
-            raise RuntimeError("maxRecentFilesSpinBox not found in preferences_dialog.ui")
-        self.max_recent_files_spin = max_recent_files_spin
-        self.max_recent_files_spin.setValue(self._settings.get_max_recent_files())
+        self.clear_recent_files_btn = widgets["clearRecentFilesButton"]
+        self.clear_recent_files_btn.clicked.connect(
+            self._on_clear_recent_files, Qt.ConnectionType.DirectConnection
+        )
 
-        clear_recent_files_btn = self._ui.findChild(QPushButton, "clearRecentFilesButton")
-        if clear_recent_files_btn is None:
-            raise RuntimeError("clearRecentFilesButton not found in preferences_dialog.ui")
-        self.clear_recent_files_btn = clear_recent_files_btn
-        self.clear_recent_files_btn.clicked.connect(self._on_clear_recent_files)
+        widgets["resetToDefaultsButton"].clicked.connect(
+            self._on_reset_defaults, Qt.ConnectionType.DirectConnection
+        )
 
-        reset_button = self._ui.findChild(QPushButton, "resetToDefaultsButton")
-        if reset_button is None:
-            raise RuntimeError("resetToDefaultsButton not found in preferences_dialog.ui")
-        reset_button.clicked.connect(self._on_reset_defaults)
+        self.button_box = widgets["buttonBox"]
+        self.button_box.accepted.connect(self.accept, Qt.ConnectionType.DirectConnection)
+        self.button_box.rejected.connect(self.reject, Qt.ConnectionType.DirectConnection)
 
-        button_box = self._ui.findChild(QDialogButtonBox, "buttonBox")
-        if button_box is None:
-            raise RuntimeError("buttonBox not found in preferences_dialog.ui")
-        self.button_box = button_box
-        self.button_box.accepted.connect(self.accept)
-        self.button_box.rejected.connect(self.reject)
+    def _reload_values(self) -> None:
+        """Populate the widgets from the current settings."""
+        self.last_dir.setText(self._settings.get_str(self._settings.keys.last_open_dir, ""))
+        self.theme_combo.setCurrentText(self._settings.get_theme())
+        # Splash screen preference: if None or 0, show 0 (until OK), otherwise the value
+        splash_seconds = self._settings.get_splash_screen_seconds()
+        self.splash_enabled_check.setChecked(splash_seconds is not None)
+        splash_value = splash_seconds if splash_seconds is not None and splash_seconds > 0 else 0
+        self.splash_seconds_spin.setValue(splash_value)
+        # toggled only fires on a change, so sync the enabled state explicitly
+        self.splash_seconds_spin.setEnabled(self.splash_enabled_check.isChecked())
+        self._splash_seconds_label.setEnabled(self.splash_enabled_check.isChecked())
+        self.max_recent_files_spin.setValue(self._settings.get_max_recent_files())
+        self._initial_values = self._widget_values()
+
+    def _widget_values(self) -> dict[str, object]:
+        """Return the current value of every editable field."""
+        return {
+            "last_dir": self.last_dir.text().strip(),
+            "theme": self.theme_combo.currentText(),
+            "splash_enabled": self.splash_enabled_check.isChecked(),
+            "splash_seconds": self.splash_seconds_spin.value(),
+            "max_recent_files": self.max_recent_files_spin.value(),
+        }
 
     def _on_reset_defaults(self) -> None:
         """Handle reset to defaults button click."""
-        from PySide6.QtWidgets import QMessageBox
-
         reply = QMessageBox.question(
             self,
             "Reset to Defaults",
@@ -131,28 +159,26 @@ class PreferencesDialog(QDialog):
         )
 
         if reply == QMessageBox.StandardButton.Yes:
-            self._settings.reset_to_defaults()
+            with self._settings.batch():
+                self._settings.reset_to_defaults()
             # Reload current values
-            self.last_dir.setText(self._settings.get_str(self._settings.keys.last_open_dir, ""))
-            self.theme_combo.setCurrentText(self._settings.get_theme())
-            # Reset splash screen preference
-            splash_seconds = self._settings.get_splash_screen_seconds()
-            self.splash_enabled_check.setChecked(splash_seconds is not None)
-            if splash_seconds is not None and splash_seconds > 0:
-                splash_value = splash_seconds
-            else:
-                splash_value = 0
-            self.splash_seconds_spin.setValue(splash_value)
-            # Reset max recent files
-            self.max_recent_files_spin.setValue(self._settings.get_max_recent_files())
+            self._reload_values()
 
     def accept(self) -> None:
-        """Validate and save preferences."""
-        from PySide6.QtWidgets import QMessageBox
+        """Validate and save preferences.
+
+        Only fields that differ from the values loaded into the dialog are
+        validated and written; OK without edits just closes the dialog.
+        """
+        values = self._widget_values()
+        changed = {key for key, value in values.items() if value != self._initial_values.get(key)}
+        if not changed:
+            super().accept()
+            return
 
         # Validate last open dir
         last_dir_text = self.last_dir.text().strip()
-        if not self._settings.validate_last_open_dir(last_dir_text):
+        if "last_dir" in changed and not self._settings.validate_last_open_dir(last_dir_text):
             QMessageBox.warning(
                 self,
                 "Invalid Directory",
@@ -163,7 +189,7 @@ class PreferencesDialog(QDialog):
 
         # Validate theme
         new_theme = self.theme_combo.currentText()
-        if not self._settings.validate_theme(new_theme):
+        if "theme" in changed and not self._settings.validate_theme(new_theme):
             QMessageBox.warning(
                 self,
                 "Invalid Theme",
@@ -171,32 +197,35 @@ class PreferencesDialog(QDialog):
             )
             return
 
-        # Save preferences
-        old_theme = self._settings.get_theme()
-        self._settings.set_str(self._settings.keys.last_open_dir, last_dir_text)
-        self._settings.set_theme(new_theme)
-
-        # Save splash screen preference
-        if self.splash_enabled_check.isChecked():
-            splash_value = self.splash_seconds_spin.value()
-            # 0 means "until OK clicked", so store as 0
-            self._settings.set_splash_screen_seconds(splash_value)
-        else:
-            # Not enabled, remove setting (defaults to None = don't show)
-            self._settings.set_splash_screen_seconds(None)
-
-        # Save max recent files
-        self._settings.set_max_recent_files(self.max_recent_files_spin.value())
-
-        if old_theme != new_theme:
+        # Save changed preferences in one batch; the flush to disk is deferred
+        # to the event loop so the dialog closes without waiting on it
+        with self._settings.batch(defer_sync=True):
+            if "last_dir" in changed:
+                self._settings.set_str(self._settings.keys.last_open_dir, last_dir_text)
+            if "theme" in changed:
+                self._settings.set_theme(new_theme)
+
+            # Save splash screen preference
+            if changed & {"splash_enabled", "splash_seconds"}:
+                if self.splash_enabled_check.isChecked():
+                    splash_value = self.splash_seconds_spin.value()
+                    # 0 means "until OK clicked", so store as 0
+                    self._settings.set_splash_screen_seconds(splash_value)
+                else:
+                    # Not enabled, remove setting (defaults to None = don't show)
+                    self._settings.set_splash_screen_seconds(None)
+
+            # Save max recent files
+            if "max_recent_files" in changed:
+                self._settings.set_max_recent_files(self.max_recent_files_spin.value())
+
+        if "theme" in changed:
             self.theme_changed.emit(new_theme)
 
         super().accept()
 
     def _on_clear_recent_files(self) -> None:
         """Handle clear recent files button click."""
-        from PySide6.QtWidgets import QMessageBox
-
         recent_count = len(self._settings.get_recent_files())
         if recent_count == 0:
             QMessageBox.information(
@@ -216,7 +245,8 @@ class PreferencesDialog(QDialog):
         )
 
         if reply == QMessageBox.StandardButton.Yes:
-            self._settings.set_recent_files([])
+            with self._settings.batch():
+                self._settings.set_recent_files([])
             QMessageBox.information(
                 self,
                 "Recent Files Cleared",
@@ -100,6 +100,8 @@ class MainWindow(QMainWindow):
         self.tray: SystemTray
         self.tab_widget: QTabWidget
         self.view_menu: QMenu
+        # Created on first open and reused afterwards
+        self._prefs_dialog: PreferencesDialog | None = None
 
         self.setWindowTitle(APP_NAME)
         self.setAcceptDrops(True)
@@ -559,9 +561,13 @@ class MainWindow(QMainWindow):
     @Slot()
     def on_open_prefs(self) -> None:
         """Open the preferences dialog and handle theme changes."""
-        dlg = PreferencesDialog(settings=self.settings, parent=self)
-        dlg.theme_changed.connect(self._on_theme_changed)
-        dlg.exec()
+        if self._prefs_dialog is None:
+            self._prefs_dialog = PreferencesDialog(settings=self.settings, parent=self)
+            # Queued so the dialog finishes closing before the app is restyled
+            self._prefs_dialog.theme_changed.connect(
+                self._on_theme_changed, Qt.ConnectionType.QueuedConnection
+            )
+        self._prefs_dialog.exec()
 
     def _on_theme_changed(self, theme: str) -> None:
         """Handle theme change from preferences dialog.
@@ -911,6 +917,8 @@ class MainWindow(QMainWindow):
 
         # Save window state
         self.window_state.save_state()
+        # Snapshot settings so the next launch can skip parsing QSettings
+        self.settings.save_snapshot()
 
         # Cleanup system tray
         if self.tray.is_available():
@@ -2,19 +2,71 @@
 
 This module provides a client for accessing the Google Photos Library API
 using the requests library. It handles all API endpoints and data retrieval.
+
+Response bodies are parsed with orjson when it is installed (it decodes the
+raw bytes directly and is several times faster on large pages) and with the
+standard json module otherwise.
 """
 
 from __future__ import annotations
 
+import contextlib
+import json
 import logging
+import queue
+import threading
+import time
+from collections.abc import Iterator
+from datetime import UTC, datetime
 from typing import Any
 
 import requests
 from google.oauth2.credentials import Credentials
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
 
 # Google Photos API base URL
 API_BASE_URL = "https://photoslibrary.googleapis.com/v1"
 
+# Endpoint URLs, built once instead of on every request
+_MEDIA_ITEMS_URL = f"{API_BASE_URL}/mediaItems"
+_MEDIA_ITEMS_SEARCH_URL = f"{API_BASE_URL}/mediaItems:search"
+_ALBUMS_URL = f"{API_BASE_URL}/albums"
+_SHARED_ALBUMS_URL = f"{API_BASE_URL}/sharedAlbums"
+
+# Longest Retry-After delay honoured, in seconds. urllib3 sleeps inside
+# session.request(), where the refresh cannot be cancelled.
+_MAX_RETRY_AFTER = 5.0
+
+
+class _CappedRetry(Retry):
+    """Retry that waits at most _MAX_RETRY_AFTER seconds for a Retry-After header."""
+
+    def get_retry_after(self, response: Any) -> float | None:
+        retry_after = super().get_retry_after(response)
+        return None if retry_after is None else min(retry_after, _MAX_RETRY_AFTER)
+
+
+# Retry rate-limited and transient server errors with exponential backoff
+# (honouring a capped Retry-After). POST is included because the only POST
+# endpoint, mediaItems:search, is a read. Exhausted retries return the last
+# response so raise_for_status() still reports the HTTP error.
+_RETRY = _CappedRetry(
+    total=3,
+    backoff_factor=0.5,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset({"GET", "POST"}),
+    raise_on_status=False,
+)
+
+# Re-check credentials this many seconds before the access token expires
+_TOKEN_REFRESH_MARGIN = 300
+
 
 class GooglePhotosClient:
     """Client for Google Photos Library API using requests library."""
@@ -29,24 +81,70 @@ class GooglePhotosClient:
         self.log = logging.getLogger(__name__)
         self.credentials = credentials
         self.debug = debug
-        self.session = requests.Session()
+        # Requests may be issued from several worker threads at once. A Session
+        # is not documented as thread-safe, so each request checks out an idle
+        # one from this pool (creating it if none is free) and returns it after;
+        # keep-alive connections are still reused across requests and refreshes.
+        self._sessions: queue.SimpleQueue[requests.Session] = queue.SimpleQueue()
+        # Only one thread should refresh the token
+        self._auth_lock = threading.Lock()
+        # Authorization header sent with every request; replaced, never mutated
+        self._auth_headers: dict[str, str] = {}
+        # time.monotonic() deadline until which the current Authorization header is trusted
+        self._auth_valid_until = 0.0
         self._update_session_auth()
 
+    @contextlib.contextmanager
+    def _session(self) -> Iterator[requests.Session]:
+        """Check out a Session that no other thread uses until it is returned."""
+        try:
+            session = self._sessions.get_nowait()
+        except queue.Empty:
+            session = requests.Session()
+            # All traffic goes to one host and a session serves one request at a time
+            session.mount(
+                "https://", HTTPAdapter(pool_connections=1, pool_maxsize=1, max_retries=_RETRY)
+            )
+        try:
+            yield session
+        finally:
+            self._sessions.put(session)
+
+    def _token_deadline(self) -> float:
+        """Return the monotonic time at which the current token must be re-checked."""
+        expiry = self.credentials.expiry
+        if expiry is None:
+            return 0.0  # Unknown lifetime: check on every request
+        # google-auth stores expiry as a naive UTC datetime
+        now = datetime.now(UTC).replace(tzinfo=None)
+        remaining = (expiry - now).total_seconds() - _TOKEN_REFRESH_MARGIN
+        return time.monotonic() + max(0.0, remaining)
+
     def _update_session_auth(self) -> None:
-        """Update session with current credentials."""
-        if not self.credentials.valid:
-            if self.credentials.expired and self.credentials.refresh_token:
-                self.credentials.refresh(requests.Request())
-            else:
-                raise ValueError("Credentials are invalid and cannot be refreshed")
+        """Update the Authorization header with current credentials.
 
-        # Set Authorization header
-        self.session.headers.update({"Authorization": f"Bearer {self.credentials.token}"})
+        Skipped while the token is known to be fresh, so most requests do not
+        touch the credentials at all.
+        """
+        if time.monotonic() < self._auth_valid_until:
+            return
+        with self._auth_lock:
+            if time.monotonic() < self._auth_valid_until:
+                return
+            if not self.credentials.valid:
+                if self.credentials.expired and self.credentials.refresh_token:
+                    self.credentials.refresh(requests.Request())
+                else:
+                    raise ValueError("Credentials are invalid and cannot be refreshed")
+
+            # Set Authorization header
+            self._auth_headers = {"Authorization": f"Bearer {self.credentials.token}"}
+            self._auth_valid_until = self._token_deadline()
 
     def _request(
         self,
         method: str,
-        endpoint: str,
+        url: str,
         params: dict[str, Any] | None = None,
         json_data: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
@@ -54,7 +152,7 @@ class GooglePhotosClient:
 
         Args:
             method: HTTP method (GET, POST, etc.)
-            endpoint: API endpoint (without base URL)
+            url: Full endpoint URL (one of the module-level *_URL constants)
             params: Query parameters
             json_data: JSON body data
 
@@ -64,13 +162,13 @@ class GooglePhotosClient:
         Raises:
             requests.RequestException: If the request fails
         """
-        url = f"{API_BASE_URL}/{endpoint.lstrip('/')}"
-
         # Ensure credentials are valid
         self._update_session_auth()
 
-        # Log request if debug is enabled
-        if self.debug:
+        # Log request if debug is enabled and INFO records would actually be
+        # emitted; otherwise skip building the log arguments entirely
+        log_api = self.debug and self.log.isEnabledFor(logging.INFO)
+        if log_api:
             self.log.info("API Request: %s %s", method, url)
             if params:
                 self.log.info("  Params: %s", params)
@@ -78,15 +176,25 @@ class GooglePhotosClient:
                 self.log.info("  JSON Body: %s", json_data)
 
         try:
-            response = self.session.request(
-                method=method, url=url, params=params, json=json_data, timeout=30
-            )
+            with self._session() as session:
+                response = session.request(
+                    method=method,
+                    url=url,
+                    params=params,
+                    json=json_data,
+                    headers=self._auth_headers,
+                    timeout=30,
+                )
 
             response.raise_for_status()
-            response_json = response.json()
+            try:
+                response_json = _json_loads(response.content)
+            except ValueError as e:
+                # Match Response.json() so callers see a RequestException
+                raise requests.JSONDecodeError(str(e), "", 0) from e
 
             # Log response if debug is enabled
-            if self.debug:
+            if log_api:
                 self.log.info("API Response: %s %s - Status: %s", method, url, response.status_code)
                 # Log response size for large responses
                 if isinstance(response_json, dict):
@@ -158,7 +266,7 @@ class GooglePhotosClient:
         if page_token:
             params["pageToken"] = page_token
 
-        return self._request("GET", "mediaItems", params=params)
+        return self._request("GET", _MEDIA_ITEMS_URL, params=params)
 
     def get_media_item(self, media_item_id: str) -> dict[str, Any]:
         """Get a specific media item by ID.
@@ -169,7 +277,7 @@ class GooglePhotosClient:
         Returns:
             Media item object
         """
-        return self._request("GET", f"mediaItems/{media_item_id}")
+        return self._request("GET", f"{_MEDIA_ITEMS_URL}/{media_item_id}")
 
     def search_media_items(
         self,
@@ -217,7 +325,7 @@ class GooglePhotosClient:
             request_body["filters"] = request_body.get("filters", {})
             request_body["filters"]["mediaTypeFilter"] = media_type_filter
 
-        return self._request("POST", "mediaItems:search", json_data=request_body)
+        return self._request("POST", _MEDIA_ITEMS_SEARCH_URL, json_data=request_body)
 
     def get_all_media_items(self, page_size: int = 100) -> list[dict[str, Any]]:
         """Get all media items (handles pagination automatically).
@@ -258,7 +366,7 @@ class GooglePhotosClient:
         if page_token:
             params["pageToken"] = page_token
 
-        return self._request("GET", "albums", params=params)
+        return self._request("GET", _ALBUMS_URL, params=params)
 
     def get_album(self, album_id: str) -> dict[str, Any]:
         """Get a specific album by ID.
@@ -269,7 +377,7 @@ class GooglePhotosClient:
         Returns:
             Album object
         """
-        return self._request("GET", f"albums/{album_id}")
+        return self._request("GET", f"{_ALBUMS_URL}/{album_id}")
 
     def get_all_albums(self, page_size: int = 50) -> list[dict[str, Any]]:
         """Get all albums (handles pagination automatically).
@@ -312,7 +420,7 @@ class GooglePhotosClient:
         if page_token:
             params["pageToken"] = page_token
 
-        return self._request("GET", "sharedAlbums", params=params)
+        return self._request("GET", _SHARED_ALBUMS_URL, params=params)
 
     def get_all_shared_albums(self, page_size: int = 50) -> list[dict[str, Any]]:
         """Get all shared albums (handles pagination automatically).
@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'dialogs_demo.ui'
+##
+## Created by: Qt User Interface Compiler version 6.7.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QFormLayout, QLabel, QPushButton,
+    QSizePolicy, QSpacerItem, QVBoxLayout, QWidget)
+
+class Ui_DialogsDemo(object):
+    def setupUi(self, DialogsDemo):
+        if not DialogsDemo.objectName():
+            DialogsDemo.setObjectName(u"DialogsDemo")
+        self.verticalLayout = QVBoxLayout(DialogsDemo)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.colorLayout = QFormLayout()
+        self.colorLayout.setObjectName(u"colorLayout")
+        self.color_button = QPushButton(DialogsDemo)
+        self.color_button.setObjectName(u"color_button")
+
+        self.colorLayout.setWidget(0, QFormLayout.LabelRole, self.color_button)
+
+        self.color_label = QLabel(DialogsDemo)
+        self.color_label.setObjectName(u"color_label")
+
+        self.colorLayout.setWidget(0, QFormLayout.FieldRole, self.color_label)
+
+
+        self.verticalLayout.addLayout(self.colorLayout)
+
+        self.fontLayout = QFormLayout()
+        self.fontLayout.setObjectName(u"fontLayout")
+        self.font_button = QPushButton(DialogsDemo)
+        self.font_button.setObjectName(u"font_button")
+
+        self.fontLayout.setWidget(0, QFormLayout.LabelRole, self.font_button)
+
+        self.font_label = QLabel(DialogsDemo)
+        self.font_label.setObjectName(u"font_label")
+
+        self.fontLayout.setWidget(0, QFormLayout.FieldRole, self.font_label)
+
+
+        self.verticalLayout.addLayout(self.fontLayout)
+
+        self.inputLayout = QFormLayout()
+        self.inputLayout.setObjectName(u"inputLayout")
+        self.textInputLabel = QLabel(DialogsDemo)
+        self.textInputLabel.setObjectName(u"textInputLabel")
+
+        self.inputLayout.setWidget(0, QFormLayout.LabelRole, self.textInputLabel)
+
+        self.text_input_btn = QPushButton(DialogsDemo)
+        self.text_input_btn.setObjectName(u"text_input_btn")
+
+        self.inputLayout.setWidget(0, QFormLayout.FieldRole, self.text_input_btn)
+
+        self.intInputLabel = QLabel(DialogsDemo)
+        self.intInputLabel.setObjectName(u"intInputLabel")
+
+        self.inputLayout.setWidget(1, QFormLayout.LabelRole, self.intInputLabel)
+
+        self.int_input_btn = QPushButton(DialogsDemo)
+        self.int_input_btn.setObjectName(u"int_input_btn")
+
+        self.inputLayout.setWidget(1, QFormLayout.FieldRole, self.int_input_btn)
+
+        self.doubleInputLabel = QLabel(DialogsDemo)
+        self.doubleInputLabel.setObjectName(u"doubleInputLabel")
+
+        self.inputLayout.setWidget(2, QFormLayout.LabelRole, self.doubleInputLabel)
+
+        self.double_input_btn = QPushButton(DialogsDemo)
+        self.double_input_btn.setObjectName(u"double_input_btn")
+
+        self.inputLayout.setWidget(2, QFormLayout.FieldRole, self.double_input_btn)
+
+        self.itemInputLabel = QLabel(DialogsDemo)
+        self.itemInputLabel.setObjectName(u"itemInputLabel")
+
+        self.inputLayout.setWidget(3, QFormLayout.LabelRole, self.itemInputLabel)
+
+        self.item_input_btn = QPushButton(DialogsDemo)
+        self.item_input_btn.setObjectName(u"item_input_btn")
+
+        self.inputLayout.setWidget(3, QFormLayout.FieldRole, self.item_input_btn)
+
+
+        self.verticalLayout.addLayout(self.inputLayout)
+
+        self.msgLayout = QFormLayout()
+        self.msgLayout.setObjectName(u"msgLayout")
+        self.infoLabel = QLabel(DialogsDemo)
+        self.infoLabel.setObjectName(u"infoLabel")
+
+        self.msgLayout.setWidget(0, QFormLayout.LabelRole, self.infoLabel)
+
+        self.info_btn = QPushButton(DialogsDemo)
+        self.info_btn.setObjectName(u"info_btn")
+
+        self.msgLayout.setWidget(0, QFormLayout.FieldRole, self.info_btn)
+
+        self.warningLabel = QLabel(DialogsDemo)
+        self.warningLabel.setObjectName(u"warningLabel")
+
+        self.msgLayout.setWidget(1, QFormLayout.LabelRole, self.warningLabel)
+
+        self.warning_btn = QPushButton(DialogsDemo)
+        self.warning_btn.setObjectName(u"warning_btn")
+
+        self.msgLayout.setWidget(1, QFormLayout.FieldRole, self.warning_btn)
+
+        self.questionLabel = QLabel(DialogsDemo)
+        self.questionLabel.setObjectName(u"questionLabel")
+
+        self.msgLayout.setWidget(2, QFormLayout.LabelRole, self.questionLabel)
+
+        self.question_btn = QPushButton(DialogsDemo)
+        self.question_btn.setObjectName(u"question_btn")
+
+        self.msgLayout.setWidget(2, QFormLayout.FieldRole, self.question_btn)
+
+
+        self.verticalLayout.addLayout(self.msgLayout)
+
+        self.verticalSpacer = QSpacerItem(20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
+
+        self.verticalLayout.addItem(self.verticalSpacer)
+
+
+        self.retranslateUi(DialogsDemo)
+
+        QMetaObject.connectSlotsByName(DialogsDemo)
+    # setupUi
+
+    def retranslateUi(self, DialogsDemo):
+        self.color_button.setText(QCoreApplication.translate("DialogsDemo", u"Choose Color", None))
+        self.color_label.setText(QCoreApplication.translate("DialogsDemo", u"Selected color will appear here", None))
+        self.font_button.setText(QCoreApplication.translate("DialogsDemo", u"Choose Font", None))
+        self.font_label.setText(QCoreApplication.translate("DialogsDemo", u"Sample text with selected font", None))
+        self.textInputLabel.setText(QCoreApplication.translate("DialogsDemo", u"Text Input:", None))
+        self.text_input_btn.setText(QCoreApplication.translate("DialogsDemo", u"Text Input", None))
+        self.intInputLabel.setText(QCoreApplication.translate("DialogsDemo", u"Integer Input:", None))
+        self.int_input_btn.setText(QCoreApplication.translate("DialogsDemo", u"Integer Input", None))
+        self.doubleInputLabel.setText(QCoreApplication.translate("DialogsDemo", u"Double Input:", None))
+        self.double_input_btn.setText(QCoreApplication.translate("DialogsDemo", u"Double Input", None))
+        self.itemInputLabel.setText(QCoreApplication.translate("DialogsDemo", u"Item Selection:", None))
+        self.item_input_btn.setText(QCoreApplication.translate("DialogsDemo", u"Item Selection", None))
+        self.infoLabel.setText(QCoreApplication.translate("DialogsDemo", u"Info:", None))
+        self.info_btn.setText(QCoreApplication.translate("DialogsDemo", u"Info Message", None))
+        self.warningLabel.setText(QCoreApplication.translate("DialogsDemo", u"Warning:", None))
+        self.warning_btn.setText(QCoreApplication.translate("DialogsDemo", u"Warning Message", None))
+        self.questionLabel.setText(QCoreApplication.translate("DialogsDemo", u"Question:", None))
+        self.question_btn.setText(QCoreApplication.translate("DialogsDemo", u"Question Message", None))
+        pass
+    # retranslateUi
+
@@ -5,10 +5,10 @@ Shows QCalendarWidget for date selection.
 
 from __future__ import annotations
 
-from PySide6.QtCore import QDate
+from PySide6.QtCore import QDate, Qt
 from PySide6.QtWidgets import QCalendarWidget, QLabel, QVBoxLayout, QWidget
 
-from ..core.ui_loader import load_ui
+from ..core.ui_loader import load_ui, named_children
 
 
 class CalendarDemo(QWidget):
@@ -23,18 +23,17 @@ class CalendarDemo(QWidget):
         layout.addWidget(ui_widget)
 
         # Find widgets
-        calendar = ui_widget.findChild(QCalendarWidget, "calendar")
-        date_label = ui_widget.findChild(QLabel, "date_label")
-
-        if calendar is None or date_label is None:
-            raise RuntimeError("Required widgets not found in calendar_demo.ui")
-
-        self.calendar = calendar
-        self.date_label = date_label
+        widgets = named_children(
+            ui_widget, {"calendar": QCalendarWidget, "date_label": QLabel}, "calendar_demo.ui"
+        )
+        self.calendar = widgets["calendar"]
+        self.date_label = widgets["date_label"]
 
         # Configure calendar
         self.calendar.setSelectedDate(QDate.currentDate())
-        self.calendar.selectionChanged.connect(self._on_date_selected)
+        self.calendar.selectionChanged.connect(
+            self._on_date_selected, Qt.ConnectionType.DirectConnection
+        )
 
         # Show initial date
         self._on_date_selected()
@@ -5,6 +5,7 @@ Shows QSpinBox, QDoubleSpinBox, QSlider, QCheckBox, QRadioButton, QComboBox, etc
 
 from __future__ import annotations
 
+from PySide6.QtCore import Qt, QTimer
 from PySide6.QtWidgets import (
     QComboBox,
     QDoubleSpinBox,
@@ -15,7 +16,16 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
-from ..core.ui_loader import load_ui
+from ..core.ui_loader import load_ui, named_children
+
+# Widgets controls_demo.ui must provide, with their expected types
+_REQUIRED_WIDGETS = {
+    "spin_box": QSpinBox,
+    "double_spin": QDoubleSpinBox,
+    "slider": QSlider,
+    "combo_box": QComboBox,
+    "value_label": QLabel,
+}
 
 
 class ControlsDemo(QWidget):
@@ -30,43 +40,53 @@ class ControlsDemo(QWidget):
         layout.addWidget(ui_widget)
 
         # Find widgets
-        spin_box = ui_widget.findChild(QSpinBox, "spin_box")
-        double_spin = ui_widget.findChild(QDoubleSpinBox, "double_spin")
-        slider = ui_widget.findChild(QSlider, "slider")
-        combo_box = ui_widget.findChild(QComboBox, "combo_box")
-        value_label = ui_widget.findChild(QLabel, "value_label")
-
-        if (
-            spin_box is None
-            or double_spin is None
-            or slider is None
-            or combo_box is None
-            or value_label is None
-        ):
-            raise RuntimeError("Required widgets not found in controls_demo.ui")
-
-        self.spin_box = spin_box
-        self.double_spin = double_spin
-        self.slider = slider
-        self.combo_box = combo_box
-        self.value_label = value_label
+        widgets = named_children(ui_widget, _REQUIRED_WIDGETS, "controls_demo.ui")
+        self.spin_box = widgets["spin_box"]
+        self.double_spin = widgets["double_spin"]
+        self.slider = widgets["slider"]
+        self.combo_box = widgets["combo_box"]
+        self.value_label = widgets["value_label"]
+
+        # Value changes arrive once per pixel while dragging; coalesce them into
+        # at most one label update per frame (~16 ms)
+        self._pending_text = ""
+        self._label_timer = QTimer(self)
+        self._label_timer.setSingleShot(True)
+        self._label_timer.setInterval(16)
+        self._label_timer.timeout.connect(self._flush_label, Qt.ConnectionType.DirectConnection)
 
         # Connect signals
-        self.spin_box.valueChanged.connect(self._on_spin_changed)
-        self.double_spin.valueChanged.connect(self._on_double_spin_changed)
-        self.slider.valueChanged.connect(self._on_slider_changed)
+        self.spin_box.valueChanged.connect(
+            self._on_spin_changed, Qt.ConnectionType.DirectConnection
+        )
+        self.double_spin.valueChanged.connect(
+            self._on_double_spin_changed, Qt.ConnectionType.DirectConnection
+        )
+        self.slider.valueChanged.connect(
+            self._on_slider_changed, Qt.ConnectionType.DirectConnection
+        )
 
         # Populate combo box
         self.combo_box.addItems(["Option 1", "Option 2", "Option 3", "Option 4"])
 
+    def _set_label_text(self, text: str) -> None:
+        """Queue text for the value label; it is applied on the next timer tick."""
+        self._pending_text = text
+        if not self._label_timer.isActive():
+            self._label_timer.start()
+
+    def _flush_label(self) -> None:
+        """Apply the most recent queued label text."""
+        self.value_label.setText(self._pending_text)
+
     def _on_spin_changed(self, value: int) -> None:
         """Handle spin box value change."""
-        self.value_label.setText(f"SpinBox value: {value}")
+        self._set_label_text(f"SpinBox value: {value}")
 
     def _on_double_spin_changed(self, value: float) -> None:
         """Handle double spin box value change."""
-        self.value_label.setText(f"DoubleSpinBox value: {value:.2f}")
+        self._set_label_text(f"DoubleSpinBox value: {value:.2f}")
 
     def _on_slider_changed(self, value: int) -> None:
         """Handle slider value change."""
-        self.value_label.setText(f"Slider value: {value}")
+        self._set_label_text(f"Slider value: {value}")
@@ -5,109 +5,125 @@ Shows various dialog types: QColorDialog, QFontDialog, QInputDialog, etc.
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from PySide6.QtGui import QColor, QFont
 from PySide6.QtWidgets import (
     QColorDialog,
     QFontDialog,
     QInputDialog,
-    QLabel,
     QMessageBox,
-    QPushButton,
-    QVBoxLayout,
     QWidget,
 )
 
-from ..core.ui_loader import load_ui
+if TYPE_CHECKING:
+    from ._dialogs_demo_ui import Ui_DialogsDemo
+
+# Initial values offered by the pickers (dialogs are GUI-thread only)
+_ITEMS = ("Apple", "Banana", "Cherry", "Date", "Elderberry")
+_DEFAULT_COLOR = QColor(255, 255, 255)
+_DEFAULT_FONT = QFont("Arial", 12)
+
+# Colour label stylesheet; text colour indexed by QColor.lightness() (0-255)
+_TEMPLATE = "background-color: {name}; padding: 10px; color: {fg};"
+_FG = ("white",) * 128 + ("black",) * 128
 
 
 class DialogsDemo(QWidget):
     """Demonstration of various dialogs."""
 
+    # Button attribute on Ui_DialogsDemo -> slot method connected to its clicked signal
+    _WIRING = (
+        ("color_button", "_show_color_dialog"),
+        ("font_button", "_show_font_dialog"),
+        ("text_input_btn", "_show_text_input"),
+        ("int_input_btn", "_show_int_input"),
+        ("double_input_btn", "_show_double_input"),
+        ("item_input_btn", "_show_item_input"),
+        ("info_btn", "_show_info_message"),
+        ("warning_btn", "_show_warning_message"),
+        ("question_btn", "_show_question_message"),
+    )
+
     def __init__(self, parent=None) -> None:
         super().__init__(parent)
-        # Load UI from .ui file
-        ui_widget = load_ui("dialogs_demo.ui", self)
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.addWidget(ui_widget)
-
-        # Find widgets
-        self.color_button = ui_widget.findChild(QPushButton, "color_button")
-        self.color_label = ui_widget.findChild(QLabel, "color_label")
-        self.font_button = ui_widget.findChild(QPushButton, "font_button")
-        self.font_label = ui_widget.findChild(QLabel, "font_label")
-        self.text_input_btn = ui_widget.findChild(QPushButton, "text_input_btn")
-        self.int_input_btn = ui_widget.findChild(QPushButton, "int_input_btn")
-        self.double_input_btn = ui_widget.findChild(QPushButton, "double_input_btn")
-        self.item_input_btn = ui_widget.findChild(QPushButton, "item_input_btn")
-        self.info_btn = ui_widget.findChild(QPushButton, "info_btn")
-        self.warning_btn = ui_widget.findChild(QPushButton, "warning_btn")
-        self.question_btn = ui_widget.findChild(QPushButton, "question_btn")
-
-        # Check each widget individually to help type checker
-        if (
-            self.color_button is None
-            or self.color_label is None
-            or self.font_button is None
-            or self.font_label is None
-            or self.text_input_btn is None
-            or self.int_input_btn is None
-            or self.double_input_btn is None
-            or self.item_input_btn is None
-            or self.info_btn is None
-            or self.warning_btn is None
-            or self.question_btn is None
-        ):
-            raise RuntimeError("Required widgets not found in dialogs_demo.ui")
+        # The widget tree is built on first show, so a tab that is never
+        # opened costs nothing at startup.
+        self._built = False
+        self.ui: Ui_DialogsDemo
+        # Message boxes by icon, created on first use and reused afterwards
+        self._boxes: dict[QMessageBox.Icon, QMessageBox] = {}
+
+    def showEvent(self, event) -> None:  # type: ignore[override]
+        """Build the UI the first time the tab is shown."""
+        if not self._built:
+            self._build_ui()
+        super().showEvent(event)
+
+    def _build_ui(self) -> None:
+        """Create the widgets and connect their signals (runs once)."""
+        # The generated module imports a long list of QtCore/QtGui names, most
+        # of them unused, so it is only imported once the tab is first shown.
+        from ._dialogs_demo_ui import Ui_DialogsDemo
+
+        self._built = True
+        # Build the widget tree from the pyside6-uic module generated from
+        # dialogs_demo.ui; the .ui file's top-level layout is installed on self.
+        self.ui = Ui_DialogsDemo()
+        self.ui.setupUi(self)
 
         # Set initial stylesheet for color label
-        self.color_label.setStyleSheet("background-color: #ffffff; padding: 10px;")
+        self.ui.color_label.setStyleSheet("background-color: #ffffff; padding: 10px;")
 
         # Connect signals
-        self.color_button.clicked.connect(self._show_color_dialog)
-        self.font_button.clicked.connect(self._show_font_dialog)
-        self.text_input_btn.clicked.connect(self._show_text_input)
-        self.int_input_btn.clicked.connect(self._show_int_input)
-        self.double_input_btn.clicked.connect(self._show_double_input)
-        self.item_input_btn.clicked.connect(self._show_item_input)
-        self.info_btn.clicked.connect(self._show_info_message)
-        self.warning_btn.clicked.connect(self._show_warning_message)
-        self.question_btn.clicked.connect(self._show_question_message)
+        for button, slot in self._WIRING:
+            getattr(self.ui, button).clicked.connect(getattr(self, slot))
+
+    def _message(self, icon: QMessageBox.Icon, title: str, text: str) -> int:
+        """Show the reusable message box for icon and return the button clicked."""
+        box = self._boxes.get(icon)
+        if box is None:
+            box = QMessageBox(icon, "", "", QMessageBox.StandardButton.Ok, self)
+            if icon == QMessageBox.Icon.Question:
+                box.setStandardButtons(
+                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+                )
+                box.setDefaultButton(QMessageBox.StandardButton.No)
+            self._boxes[icon] = box
+        box.setWindowTitle(title)
+        box.setText(text)
+        return box.exec()
 
     def _show_color_dialog(self) -> None:
         """Show color dialog and update label."""
-        if self.color_label is None:
-            return
-        color = QColorDialog.getColor(QColor(255, 255, 255), self, "Choose Color")
+        color = QColorDialog.getColor(_DEFAULT_COLOR, self, "Choose Color")
         if color.isValid():
-            self.color_label.setStyleSheet(
-                f"background-color: {color.name()}; padding: 10px; color: "
-                f"{'white' if color.lightness() < 128 else 'black'};"
+            name = color.name()
+            self.ui.color_label.setStyleSheet(
+                _TEMPLATE.format(name=name, fg=_FG[color.lightness()])
             )
-            self.color_label.setText(f"Color: {color.name()}")
+            self.ui.color_label.setText(f"Color: {name}")
 
     def _show_font_dialog(self) -> None:
         """Show font dialog and update label."""
-        if self.font_label is None:
-            return
-        font_result = QFontDialog.getFont(QFont("Arial", 12), self, "Choose Font")
+        font_result = QFontDialog.getFont(_DEFAULT_FONT, self, "Choose Font")
         if isinstance(font_result, tuple) and len(font_result) == 2:
             font, ok = font_result
             if ok and isinstance(font, QFont):
-                self.font_label.setFont(font)
-                self.font_label.setText(f"Sample text ({font.family()}, {font.pointSize()}pt)")
+                self.ui.font_label.setFont(font)
+                self.ui.font_label.setText(f"Sample text ({font.family()}, {font.pointSize()}pt)")
 
     def _show_text_input(self) -> None:
         """Show text input dialog."""
         text, ok = QInputDialog.getText(self, "Text Input", "Enter text:")
         if ok and text:
-            QMessageBox.information(self, "Result", f"You entered: {text}")
+            self._message(QMessageBox.Icon.Information, "Result", f"You entered: {text}")
 
     def _show_int_input(self) -> None:
         """Show integer input dialog."""
         value, ok = QInputDialog.getInt(self, "Integer Input", "Enter number:", 0, 0, 100)
         if ok:
-            QMessageBox.information(self, "Result", f"You entered: {value}")
+            self._message(QMessageBox.Icon.Information, "Result", f"You entered: {value}")
 
     def _show_double_input(self) -> None:
         """Show double input dialog."""
@@ -115,33 +131,28 @@ class DialogsDemo(QWidget):
             self, "Double Input", "Enter number:", 0.0, 0.0, 100.0, 2
         )
         if ok:
-            QMessageBox.information(self, "Result", f"You entered: {value:.2f}")
+            self._message(QMessageBox.Icon.Information, "Result", f"You entered: {value:.2f}")
 
     def _show_item_input(self) -> None:
         """Show item selection dialog."""
-        items = ["Apple", "Banana", "Cherry", "Date", "Elderberry"]
-        item, ok = QInputDialog.getItem(self, "Item Selection", "Choose item:", items, 0, False)
+        item, ok = QInputDialog.getItem(self, "Item Selection", "Choose item:", _ITEMS, 0, False)
         if ok:
-            QMessageBox.information(self, "Result", f"You selected: {item}")
+            self._message(QMessageBox.Icon.Information, "Result", f"You selected: {item}")
 
     def _show_info_message(self) -> None:
         """Show info message box."""
-        QMessageBox.information(self, "Information", "This is an informational message.")
+        self._message(
+            QMessageBox.Icon.Information, "Information", "This is an informational message."
+        )
 
     def _show_warning_message(self) -> None:
         """Show warning message box."""
-        QMessageBox.warning(self, "Warning", "This is a warning message!")
+        self._message(QMessageBox.Icon.Warning, "Warning", "This is a warning message!")
 
     def _show_question_message(self) -> None:
         """Show question message box."""
-        reply = QMessageBox.question(
-            self,
-            "Question",
-            "Do you want to proceed?",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-            QMessageBox.StandardButton.No,
-        )
+        reply = self._message(QMessageBox.Icon.Question, "Question", "Do you want to proceed?")
         if reply == QMessageBox.StandardButton.Yes:
-            QMessageBox.information(self, "Result", "You clicked Yes!")
+            self._message(QMessageBox.Icon.Information, "Result", "You clicked Yes!")
         else:
-            QMessageBox.information(self, "Result", "You clicked No.")
+            self._message(QMessageBox.Icon.Information, "Result", "You clicked No.")
@@ -2,26 +2,39 @@
 
 This widget displays Google Photos data retrieved from the API,
 including media items, albums, and shared albums.
+
+The details pane pretty-prints items with orjson when it is installed and
+with the standard json module otherwise.
 """
 
 from __future__ import annotations
 
 import json
 import logging
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
 from pathlib import Path
 from typing import Any, cast
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import (
+    QAbstractTableModel,
+    QModelIndex,
+    QPersistentModelIndex,
+    Qt,
+    QTimer,
+    Signal,
+)
 from PySide6.QtWidgets import (
     QFileDialog,
     QLabel,
     QMessageBox,
+    QPlainTextEdit,
     QProgressDialog,
     QPushButton,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QTabWidget,
-    QTextEdit,
     QVBoxLayout,
     QWidget,
 )
@@ -32,12 +45,167 @@ from ..core.workers import WorkContext, Worker, WorkerPool, WorkRequest
 from ..photos.auth import GooglePhotosAuth
 from ..photos.client import GooglePhotosClient
 
-# Type alias for worker result tuple
-WorkerResult = tuple[list[dict[str, Any]], list[dict[str, Any]], list[dict[str, Any]]]
+try:
+    from orjson import OPT_INDENT_2
+    from orjson import dumps as _orjson_dumps
+except ImportError:
+    _orjson_dumps = None
+
+# Table cell text stored column-major: one tuple per column, indexed by row
+ColumnCells = list[tuple[str, ...]]
+# Records from one endpoint and their pre-formatted table cells
+TableData = tuple[list[dict[str, Any]], ColumnCells]
+# Type alias for worker result tuple (media items, albums, shared albums)
+WorkerResult = tuple[TableData, TableData, TableData]
 
 # Token file name (same as in auth.py)
 TOKEN_FILE = "google_photos_token.json"
 
+# Minimum seconds between refresh progress dialog updates
+_PROGRESS_INTERVAL = 0.1
+
+
+# Invalid index standing for the (flat) model's root
+_ROOT = QModelIndex()
+
+# Builds the display text of every column for one API record
+RowFormatter = Callable[[dict[str, Any]], tuple[str, ...]]
+
+MEDIA_ITEM_COLUMNS = ("ID", "Filename", "MIME Type", "Created", "Width × Height")
+ALBUM_COLUMNS = ("ID", "Title", "Items Count", "Writeable")
+# Initial pixel widths of all but the last column, which stretches to fill
+_MEDIA_ITEM_WIDTHS = (220, 260, 100, 180)
+_ALBUM_WIDTHS = (220, 300, 100)
+
+
+def media_item_cells(item: dict[str, Any]) -> tuple[str, ...]:
+    """Return the MEDIA_ITEM_COLUMNS cells for a media item."""
+    get = item.get
+    metadata = get("mediaMetadata") or {}
+    width = metadata.get("width")
+    height = metadata.get("height")
+    return (
+        get("id", ""),
+        get("filename", ""),
+        get("mimeType", ""),
+        metadata.get("creationTime", ""),
+        f"{width} × {height}" if width and height else "",
+    )
+
+
+def album_cells(album: dict[str, Any]) -> tuple[str, ...]:
+    """Return the ALBUM_COLUMNS cells for an album or shared album."""
+    get = album.get
+    return (
+        get("id", ""),
+        get("title", ""),
+        str(get("mediaItemsCount", 0)),
+        "Yes" if get("isWriteable", False) else "No",
+    )
+
+
+def format_cells(records: list[dict[str, Any]], row_cells: RowFormatter) -> ColumnCells:
+    """Format every row of records into column-major cells; safe off the GUI thread."""
+    return list(zip(*map(row_cells, records), strict=True))
+
+
+def _pretty_json(data: dict[str, Any]) -> str:
+    """Return data as JSON indented by two spaces."""
+    if _orjson_dumps is not None:
+        try:
+            return _orjson_dumps(data, option=OPT_INDENT_2).decode()
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits, which the json module handles
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+
+class RecordTableModel(QAbstractTableModel):
+    """Read-only table model over a list of API records (dicts).
+
+    Cell text is formatted once per refresh (by the refresh worker, or here
+    if no cells are passed in) and held as one tuple per column, so a refresh
+    costs one model reset instead of an item object per cell, and sorting
+    and reordering run over flat tuples with C-level key functions.
+    """
+
+    def __init__(self, columns: Sequence[str], row_cells: RowFormatter, parent=None) -> None:
+        super().__init__(parent)
+        self._columns = tuple(columns)
+        self._row_cells = row_cells
+        self._records: list[dict[str, Any]] = []
+        self._cells: ColumnCells = [() for _ in self._columns]
+        # Last sort requested by the view, re-applied when records are replaced
+        self._sort: tuple[int, Qt.SortOrder] | None = None
+
+    def set_records(self, records: list[dict[str, Any]], cells: ColumnCells | None = None) -> None:
+        """Replace all rows.
+
+        Args:
+            records: API records, one per row
+            cells: Output of format_cells() for records, if already computed
+        """
+        self.beginResetModel()
+        self._records = list(records)
+        if cells is None:
+            cells = format_cells(records, self._row_cells)
+        self._cells = cells or [() for _ in self._columns]
+        if self._sort is not None:
+            self._reorder(self._sort_order(*self._sort))
+        self.endResetModel()
+
+    def record(self, row: int) -> dict[str, Any]:
+        """Return the record shown in row."""
+        return self._records[row]
+
+    def rowCount(self, parent: QModelIndex | QPersistentModelIndex = _ROOT) -> int:
+        return 0 if parent.isValid() else len(self._records)
+
+    def columnCount(self, parent: QModelIndex | QPersistentModelIndex = _ROOT) -> int:
+        return 0 if parent.isValid() else len(self._columns)
+
+    def data(
+        self, index: QModelIndex | QPersistentModelIndex, role: int = Qt.ItemDataRole.DisplayRole
+    ) -> Any:
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+        return self._cells[index.column()][index.row()]
+
+    def headerData(
+        self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole
+    ) -> Any:
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self._columns[section]
+        return super().headerData(section, orientation, role)
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder) -> None:
+        if not 0 <= column < len(self._columns):
+            return
+        self._sort = (column, order)
+        self.layoutAboutToBeChanged.emit()
+        old_rows = self._sort_order(column, order)
+        new_row = [0] * len(old_rows)
+        for new, old in enumerate(old_rows):
+            new_row[old] = new
+        self._reorder(old_rows)
+        persistent = self.persistentIndexList()
+        self.changePersistentIndexList(
+            persistent, [self.index(new_row[index.row()], index.column()) for index in persistent]
+        )
+        self.layoutChanged.emit()
+
+    def _sort_order(self, column: int, order: Qt.SortOrder) -> list[int]:
+        """Return current row numbers in the requested display order."""
+        cells = self._cells[column]
+        return sorted(
+            range(len(cells)),
+            key=cells.__getitem__,
+            reverse=order == Qt.SortOrder.DescendingOrder,
+        )
+
+    def _reorder(self, old_rows: list[int]) -> None:
+        self._records = list(map(self._records.__getitem__, old_rows))
+        self._cells = [tuple(map(column.__getitem__, old_rows)) for column in self._cells]
+
 
 class GooglePhotosView(QWidget):
     """Widget for viewing Google Photos data from the API."""
@@ -89,10 +257,10 @@ class GooglePhotosView(QWidget):
             raise RuntimeError("mediaItemsCountLabel not found in google_photos_view.ui")
         self.media_items_count_label = cast(QLabel, media_items_count_label)
 
-        media_items_table = ui_widget.findChild(QTableWidget, "mediaItemsTable")
+        media_items_table = ui_widget.findChild(QTableView, "mediaItemsTable")
         if media_items_table is None:
             raise RuntimeError("mediaItemsTable not found in google_photos_view.ui")
-        self.media_items_table = cast(QTableWidget, media_items_table)
+        self.media_items_table = cast(QTableView, media_items_table)
 
         # Albums tab
         albums_count_label = ui_widget.findChild(QLabel, "albumsCountLabel")
@@ -100,10 +268,10 @@ class GooglePhotosView(QWidget):
             raise RuntimeError("albumsCountLabel not found in google_photos_view.ui")
         self.albums_count_label = cast(QLabel, albums_count_label)
 
-        albums_table = ui_widget.findChild(QTableWidget, "albumsTable")
+        albums_table = ui_widget.findChild(QTableView, "albumsTable")
         if albums_table is None:
             raise RuntimeError("albumsTable not found in google_photos_view.ui")
-        self.albums_table = cast(QTableWidget, albums_table)
+        self.albums_table = cast(QTableView, albums_table)
 
         # Shared Albums tab
         shared_albums_count_label = ui_widget.findChild(QLabel, "sharedAlbumsCountLabel")
@@ -111,25 +279,57 @@ class GooglePhotosView(QWidget):
             raise RuntimeError("sharedAlbumsCountLabel not found in google_photos_view.ui")
         self.shared_albums_count_label = cast(QLabel, shared_albums_count_label)
 
-        shared_albums_table = ui_widget.findChild(QTableWidget, "sharedAlbumsTable")
+        shared_albums_table = ui_widget.findChild(QTableView, "sharedAlbumsTable")
         if shared_albums_table is None:
             raise RuntimeError("sharedAlbumsTable not found in google_photos_view.ui")
-        self.shared_albums_table = cast(QTableWidget, shared_albums_table)
+        self.shared_albums_table = cast(QTableView, shared_albums_table)
 
         # Details tab
-        details_text = ui_widget.findChild(QTextEdit, "detailsText")
+        details_text = ui_widget.findChild(QPlainTextEdit, "detailsText")
         if details_text is None:
             raise RuntimeError("detailsText not found in google_photos_view.ui")
-        self.details_text = cast(QTextEdit, details_text)
+        self.details_text = cast(QPlainTextEdit, details_text)
 
         # Connect signals
         self.authenticate_button.clicked.connect(self.on_authenticate)
         self.refresh_button.clicked.connect(self.on_refresh_data)
 
-        # Connect table selection changes to show details
-        self.media_items_table.itemSelectionChanged.connect(self.on_media_item_selected)
-        self.albums_table.itemSelectionChanged.connect(self.on_album_selected)
-        self.shared_albums_table.itemSelectionChanged.connect(self.on_shared_album_selected)
+        # Table models
+        self.media_items_model = RecordTableModel(MEDIA_ITEM_COLUMNS, media_item_cells, self)
+        self.albums_model = RecordTableModel(ALBUM_COLUMNS, album_cells, self)
+        self.shared_albums_model = RecordTableModel(ALBUM_COLUMNS, album_cells, self)
+        self.media_items_table.setModel(self.media_items_model)
+        self.albums_table.setModel(self.albums_model)
+        self.shared_albums_table.setModel(self.shared_albums_model)
+        # Fixed starting widths; measuring every cell after each refresh
+        # (resizeColumnsToContents) costs a font-metrics pass per row.
+        for table, widths in (
+            (self.media_items_table, _MEDIA_ITEM_WIDTHS),
+            (self.albums_table, _ALBUM_WIDTHS),
+            (self.shared_albums_table, _ALBUM_WIDTHS),
+        ):
+            header = table.horizontalHeader()
+            header.setStretchLastSection(True)
+            for column, width in enumerate(widths):
+                header.resizeSection(column, width)
+
+        # Show details for the current row of each table. The current row can
+        # change several times in a row (keyboard navigation, click-drag), so
+        # the details are rendered once it has settled.
+        self._pending_selection: Callable[[], None] | None = None
+        self._selection_timer = QTimer(self)
+        self._selection_timer.setSingleShot(True)
+        self._selection_timer.setInterval(50)
+        self._selection_timer.timeout.connect(self._apply_pending_selection)
+        for table, model, item_type in (
+            (self.media_items_table, self.media_items_model, "Media Item"),
+            (self.albums_table, self.albums_model, "Album"),
+            (self.shared_albums_table, self.shared_albums_model, "Shared Album"),
+        ):
+            show = partial(self._show_current_row, table, model, item_type)
+            table.selectionModel().currentChanged.connect(
+                lambda *_, show=show: self._queue_selection(show)
+            )
 
         # Initialize state
         self.auth: GooglePhotosAuth | None = None
@@ -277,6 +477,13 @@ class GooglePhotosView(QWidget):
         client = self.client
         assert client is not None  # Type narrowing
 
+        # Show progress. Disable the button before anything below can spin the
+        # event loop: a modal QProgressDialog's setValue() processes events, so
+        # a queued second click could otherwise re-enter before active_worker
+        # is set.
+        self.refresh_button.setEnabled(False)
+        self.refresh_button.setText("Loading...")
+
         # Create progress dialog
         progress_dialog = QProgressDialog(
             "Loading data from Google Photos...", "Cancel", 0, 100, self
@@ -286,60 +493,84 @@ class GooglePhotosView(QWidget):
         progress_dialog.setMinimumDuration(0)  # Show immediately
         progress_dialog.setValue(0)
 
-        # Show progress
-        self.refresh_button.setEnabled(False)
-        self.refresh_button.setText("Loading...")
-
         def work(ctx: WorkContext) -> WorkerResult:
             """Background work function - runs in worker thread.
 
-            Fetches a single page of data from the Google Photos API.
+            Fetches a single page of data from the Google Photos API. The three
+            endpoints are independent, so they are requested concurrently and
+            the total wait is the slowest request rather than the sum of all.
             """
-            # Fetch media items (single page)
-            ctx.progress(10, "Fetching media items...")
-            ctx.check_cancelled()
-            media_response = client.list_media_items(page_size=100)
-            media_items = media_response.get("mediaItems", [])
-
-            # Fetch albums (single page)
-            ctx.progress(50, "Fetching albums...")
-            ctx.check_cancelled()
-            albums_response = client.list_albums(page_size=50)
-            albums = albums_response.get("albums", [])
-
-            # Fetch shared albums (single page)
-            ctx.progress(90, "Fetching shared albums...")
+            fetches: dict[str, Callable[[], list[dict[str, Any]]]] = {
+                "media items": lambda: client.list_media_items(page_size=100).get("mediaItems", []),
+                "albums": lambda: client.list_albums(page_size=50).get("albums", []),
+                "shared albums": lambda: client.list_shared_albums(page_size=50).get(
+                    "sharedAlbums", []
+                ),
+            }
+            ctx.progress(10, "Fetching media items, albums and shared albums...")
             ctx.check_cancelled()
-            shared_albums_response = client.list_shared_albums(page_size=50)
-            shared_albums = shared_albums_response.get("sharedAlbums", [])
-
+            results: dict[str, list[dict[str, Any]]] = {}
+            executor = ThreadPoolExecutor(max_workers=len(fetches))
+            try:
+                futures = {executor.submit(fetch): name for name, fetch in fetches.items()}
+                for finished, future in enumerate(as_completed(futures), start=1):
+                    name = futures[future]
+                    results[name] = future.result()
+                    ctx.progress(10 + 90 * finished // len(fetches), f"Fetched {name}")
+                    ctx.check_cancelled()
+            finally:
+                # On error or cancellation, drop queued fetches but wait for any
+                # request still in flight: the refresh button stays disabled until
+                # this worker returns, so no new refresh overlaps an abandoned one.
+                executor.shutdown(wait=True, cancel_futures=True)
+
+            # Format the table cells here so the GUI thread only swaps models
+            media_items = results["media items"]
+            albums = results["albums"]
+            shared_albums = results["shared albums"]
+            tables: WorkerResult = (
+                (media_items, format_cells(media_items, media_item_cells)),
+                (albums, format_cells(albums, album_cells)),
+                (shared_albums, format_cells(shared_albums, album_cells)),
+            )
             ctx.progress(100, "Complete")
-            return (media_items, albums, shared_albums)
+            return tables
+
+        last_update = 0.0
 
         def progress(percent: int, message: str) -> None:
-            """Progress callback - runs on main thread via signal."""
+            """Progress callback - runs on main thread via signal.
+
+            Updates are limited to ten per second: on a modal dialog every
+            setValue() runs a nested processEvents() and repaints the label.
+            """
+            nonlocal last_update
+            if progress_dialog.wasCanceled():
+                return  # Keep showing "Cancelling..." until the worker returns
+            now = time.monotonic()
+            if percent < 100 and now - last_update < _PROGRESS_INTERVAL:
+                return
+            last_update = now
             progress_dialog.setValue(percent)
             if message:
                 progress_dialog.setLabelText(message)
                 self.refresh_button.setText(message)
-            # Process events to update UI
-            progress_dialog.show()
 
         def done(result: WorkerResult) -> None:
             """Completion callback - runs on main thread when worker finishes."""
             progress_dialog.close()
 
-            media_items, albums, shared_albums = result
+            (media_items, media_cells), (albums, album_cells), (shared, shared_cells) = result
 
             # Update data
             self.media_items = media_items
             self.albums = albums
-            self.shared_albums = shared_albums
+            self.shared_albums = shared
 
             # Populate tables
-            self._populate_media_items_table()
-            self._populate_albums_table()
-            self._populate_shared_albums_table()
+            self._populate_media_items_table(media_cells)
+            self._populate_albums_table(album_cells)
+            self._populate_shared_albums_table(shared_cells)
 
             # Show completion message
             QMessageBox.information(
@@ -391,6 +622,8 @@ class GooglePhotosView(QWidget):
         def cancel_work() -> None:
             if self.active_worker is not None:
                 self.active_worker.cancel()
+                # Requests already sent are waited for before the worker returns
+                self.refresh_button.setText("Cancelling...")
 
         progress_dialog.canceled.connect(cancel_work)
 
@@ -405,140 +638,63 @@ class GooglePhotosView(QWidget):
 
     def _clear_all_tables(self) -> None:
         """Clear all data tables."""
-        self.media_items_table.setRowCount(0)
-        self.albums_table.setRowCount(0)
-        self.shared_albums_table.setRowCount(0)
+        self.media_items_model.set_records([])
+        self.albums_model.set_records([])
+        self.shared_albums_model.set_records([])
         self.media_items_count_label.setText("0 media items")
         self.albums_count_label.setText("0 albums")
         self.shared_albums_count_label.setText("0 shared albums")
         self.details_text.clear()
 
-    def _populate_media_items_table(self) -> None:
-        """Populate the media items table."""
-        self.media_items_table.setRowCount(len(self.media_items))
-        self.media_items_count_label.setText(f"{len(self.media_items)} media items")
+    def _populate_media_items_table(self, cells: ColumnCells | None = None) -> None:
+        """Populate the media items table.
 
-        for row, item in enumerate(self.media_items):
-            # ID
-            id_item = QTableWidgetItem(item.get("id", ""))
-            id_item.setData(Qt.ItemDataRole.UserRole, item)  # Store full item data
-            self.media_items_table.setItem(row, 0, id_item)
-
-            # Filename
-            filename_item = QTableWidgetItem(item.get("filename", ""))
-            self.media_items_table.setItem(row, 1, filename_item)
-
-            # MIME Type
-            mime_item = QTableWidgetItem(item.get("mimeType", ""))
-            self.media_items_table.setItem(row, 2, mime_item)
-
-            # Created time
-            metadata = item.get("mediaMetadata", {})
-            created_item = QTableWidgetItem(metadata.get("creationTime", ""))
-            self.media_items_table.setItem(row, 3, created_item)
-
-            # Dimensions
-            width = metadata.get("width", "")
-            height = metadata.get("height", "")
-            dims_item = QTableWidgetItem(f"{width} × {height}" if width and height else "")
-            self.media_items_table.setItem(row, 4, dims_item)
-
-        # Resize columns to content
-        self.media_items_table.resizeColumnsToContents()
-
-    def _populate_albums_table(self) -> None:
-        """Populate the albums table."""
-        self.albums_table.setRowCount(len(self.albums))
-        self.albums_count_label.setText(f"{len(self.albums)} albums")
-
-        for row, album in enumerate(self.albums):
-            # ID
-            id_item = QTableWidgetItem(album.get("id", ""))
-            id_item.setData(Qt.ItemDataRole.UserRole, album)  # Store full album data
-            self.albums_table.setItem(row, 0, id_item)
-
-            # Title
-            title_item = QTableWidgetItem(album.get("title", ""))
-            self.albums_table.setItem(row, 1, title_item)
+        Args:
+            cells: format_cells() output for self.media_items, if already computed
+        """
+        self.media_items_count_label.setText(f"{len(self.media_items)} media items")
+        self.media_items_model.set_records(self.media_items, cells)
 
-            # Items count
-            count_item = QTableWidgetItem(str(album.get("mediaItemsCount", 0)))
-            self.albums_table.setItem(row, 2, count_item)
+    def _populate_albums_table(self, cells: ColumnCells | None = None) -> None:
+        """Populate the albums table.
 
-            # Writeable
-            writeable_item = QTableWidgetItem("Yes" if album.get("isWriteable", False) else "No")
-            self.albums_table.setItem(row, 3, writeable_item)
+        Args:
+            cells: format_cells() output for self.albums, if already computed
+        """
+        self.albums_count_label.setText(f"{len(self.albums)} albums")
+        self.albums_model.set_records(self.albums, cells)
 
-        # Resize columns to content
-        self.albums_table.resizeColumnsToContents()
+    def _populate_shared_albums_table(self, cells: ColumnCells | None = None) -> None:
+        """Populate the shared albums table.
 
-    def _populate_shared_albums_table(self) -> None:
-        """Populate the shared albums table."""
-        self.shared_albums_table.setRowCount(len(self.shared_albums))
+        Args:
+            cells: format_cells() output for self.shared_albums, if already computed
+        """
         self.shared_albums_count_label.setText(f"{len(self.shared_albums)} shared albums")
+        self.shared_albums_model.set_records(self.shared_albums, cells)
 
-        for row, album in enumerate(self.shared_albums):
-            # ID
-            id_item = QTableWidgetItem(album.get("id", ""))
-            id_item.setData(Qt.ItemDataRole.UserRole, album)  # Store full album data
-            self.shared_albums_table.setItem(row, 0, id_item)
-
-            # Title
-            title_item = QTableWidgetItem(album.get("title", ""))
-            self.shared_albums_table.setItem(row, 1, title_item)
+    def _queue_selection(self, handler: Callable[[], None]) -> None:
+        """Run handler once the current row has stopped changing."""
+        self._pending_selection = handler
+        self._selection_timer.start()
 
-            # Items count
-            count_item = QTableWidgetItem(str(album.get("mediaItemsCount", 0)))
-            self.shared_albums_table.setItem(row, 2, count_item)
+    def _apply_pending_selection(self) -> None:
+        """Show details for the most recently changed current row."""
+        handler, self._pending_selection = self._pending_selection, None
+        if handler is not None:
+            handler()
 
-            # Writeable
-            writeable_item = QTableWidgetItem("Yes" if album.get("isWriteable", False) else "No")
-            self.shared_albums_table.setItem(row, 3, writeable_item)
+    def _show_current_row(self, table: QTableView, model: RecordTableModel, item_type: str) -> None:
+        """Show details for the record in the current row of table.
 
-        # Resize columns to content
-        self.shared_albums_table.resizeColumnsToContents()
-
-    def on_media_item_selected(self) -> None:
-        """Handle media item selection to show details."""
-        selected_items = self.media_items_table.selectedItems()
-        if not selected_items:
-            return
-
-        # Get the first selected row's data
-        row = selected_items[0].row()
-        id_item = self.media_items_table.item(row, 0)
-        if id_item:
-            item_data = id_item.data(Qt.ItemDataRole.UserRole)
-            if item_data:
-                self._show_item_details(item_data, "Media Item")
-
-    def on_album_selected(self) -> None:
-        """Handle album selection to show details."""
-        selected_items = self.albums_table.selectedItems()
-        if not selected_items:
-            return
-
-        # Get the first selected row's data
-        row = selected_items[0].row()
-        id_item = self.albums_table.item(row, 0)
-        if id_item:
-            album_data = id_item.data(Qt.ItemDataRole.UserRole)
-            if album_data:
-                self._show_item_details(album_data, "Album")
-
-    def on_shared_album_selected(self) -> None:
-        """Handle shared album selection to show details."""
-        selected_items = self.shared_albums_table.selectedItems()
-        if not selected_items:
-            return
-
-        # Get the first selected row's data
-        row = selected_items[0].row()
-        id_item = self.shared_albums_table.item(row, 0)
-        if id_item:
-            album_data = id_item.data(Qt.ItemDataRole.UserRole)
-            if album_data:
-                self._show_item_details(album_data, "Shared Album")
+        Args:
+            table: One of the three data tables
+            model: The RecordTableModel shown by table
+            item_type: Type of item (for display)
+        """
+        current = table.currentIndex()
+        if current.isValid():
+            self._show_item_details(model.record(current.row()), item_type)
 
     def _show_item_details(self, data: dict[str, Any], item_type: str) -> None:
         """Show detailed JSON view of the selected item.
@@ -552,7 +708,7 @@ class GooglePhotosView(QWidget):
 
         # Format JSON with indentation
         try:
-            json_str = json.dumps(data, indent=2, ensure_ascii=False)
+            json_str = _pretty_json(data)
             self.details_text.setPlainText(f"{item_type} Details:\n\n{json_str}")
         except Exception as e:
             self.log.error("Failed to format details: %s", e)
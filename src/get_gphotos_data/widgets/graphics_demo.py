@@ -8,6 +8,7 @@ from __future__ import annotations
 from PySide6.QtGui import QBrush, QColor, QPainter, QPen
 from PySide6.QtWidgets import (
     QGraphicsEllipseItem,
+    QGraphicsItem,
     QGraphicsRectItem,
     QGraphicsScene,
     QGraphicsTextItem,
@@ -18,6 +19,12 @@ from PySide6.QtWidgets import (
 
 from ..core.ui_loader import load_ui
 
+# Shared by the sample shapes; QBrush and QPen are implicitly shared
+_OUTLINE_PEN = QPen(QColor(0, 0, 0), 2)
+_BLUE_BRUSH = QBrush(QColor(100, 150, 200))
+_RED_BRUSH = QBrush(QColor(200, 100, 100))
+_GREEN_BRUSH = QBrush(QColor(100, 200, 100))
+
 
 class GraphicsDemo(QWidget):
     """Demonstration of QGraphicsView with custom graphics."""
@@ -44,14 +51,14 @@ class GraphicsDemo(QWidget):
         # Add some sample graphics items
         # Rectangle
         rect = QGraphicsRectItem(50, 50, 100, 80)
-        rect.setBrush(QBrush(QColor(100, 150, 200)))
-        rect.setPen(QPen(QColor(0, 0, 0), 2))
+        rect.setBrush(_BLUE_BRUSH)
+        rect.setPen(_OUTLINE_PEN)
         self.scene.addItem(rect)
 
         # Circle
         ellipse = QGraphicsEllipseItem(200, 50, 100, 100)
-        ellipse.setBrush(QBrush(QColor(200, 100, 100)))
-        ellipse.setPen(QPen(QColor(0, 0, 0), 2))
+        ellipse.setBrush(_RED_BRUSH)
+        ellipse.setPen(_OUTLINE_PEN)
         self.scene.addItem(ellipse)
 
         # Text
@@ -62,9 +69,13 @@ class GraphicsDemo(QWidget):
 
         # Another rectangle
         rect2 = QGraphicsRectItem(200, 200, 120, 60)
-        rect2.setBrush(QBrush(QColor(100, 200, 100)))
-        rect2.setPen(QPen(QColor(0, 0, 0), 2))
+        rect2.setBrush(_GREEN_BRUSH)
+        rect2.setPen(_OUTLINE_PEN)
         self.scene.addItem(rect2)
 
+        # Repaints blit each item from a cached pixmap instead of redrawing it
+        for item in (rect, ellipse, text, rect2):
+            item.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
+
         # Set scene rectangle to fit all items
         self.scene.setSceneRect(0, 0, 400, 300)
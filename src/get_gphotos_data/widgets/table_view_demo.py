@@ -6,7 +6,7 @@ Shows QTableView with QStandardItemModel for displaying tabular data.
 from __future__ import annotations
 
 from PySide6.QtGui import QStandardItem, QStandardItemModel
-from PySide6.QtWidgets import QTableView, QVBoxLayout, QWidget
+from PySide6.QtWidgets import QAbstractItemView, QTableView, QVBoxLayout, QWidget
 
 from ..core.ui_loader import load_ui
 
@@ -41,13 +41,13 @@ class TableViewDemo(QWidget):
             ("archive.zip", "Archive", "12.3 MB", "2024-01-11"),
         ]
 
+        # The model is filled before it is attached to the view, so row
+        # insertions do not trigger view relayouts
         for row_data in sample_data:
-            row = []
-            for item_data in row_data:
-                item = QStandardItem(item_data)
-                item.setEditable(False)
-                row.append(item)
-            self.model.appendRow(row)
+            self.model.appendRow([QStandardItem(text) for text in row_data])
+
+        # Read-only at the view level rather than one setEditable() per cell
+        self.table_view.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
 
         # Set column widths
         self.table_view.setModel(self.model)
@@ -5,12 +5,35 @@ Shows QTextEdit with rich text formatting capabilities.
 
 from __future__ import annotations
 
+from collections.abc import Callable
+from typing import Any
+
 from PySide6.QtGui import QTextCharFormat
 from PySide6.QtWidgets import QPushButton, QTextEdit, QVBoxLayout, QWidget
 
 from ..core.ui_loader import load_ui
 
 
+def _toggle_formats(
+    setter: Callable[[QTextCharFormat, Any], None], off: Any, on: Any
+) -> tuple[QTextCharFormat, QTextCharFormat]:
+    """Build the (unchecked, checked) formats for one toggle button."""
+    formats = QTextCharFormat(), QTextCharFormat()
+    setter(formats[0], off)
+    setter(formats[1], on)
+    return formats
+
+
+# Formats applied by each toggle, indexed by the button's checked state
+_BOLD = _toggle_formats(QTextCharFormat.setFontWeight, 400, 700)
+_ITALIC = _toggle_formats(QTextCharFormat.setFontItalic, False, True)
+_UNDERLINE = _toggle_formats(
+    QTextCharFormat.setUnderlineStyle,
+    QTextCharFormat.UnderlineStyle.NoUnderline,
+    QTextCharFormat.UnderlineStyle.SingleUnderline,
+)
+
+
 class TextEditorDemo(QWidget):
     """Demonstration of QTextEdit with rich text formatting."""
 
@@ -35,6 +58,8 @@ class TextEditorDemo(QWidget):
         self.italic_btn = italic_btn
         self.underline_btn = underline_btn
         self.text_edit = text_edit
+        # (bold, italic, underline) last pushed to the buttons
+        self._last_fmt_state: tuple[bool, bool, bool] | None = None
 
         # Connect signals
         self.bold_btn.clicked.connect(self._toggle_bold)
@@ -52,50 +77,42 @@ class TextEditorDemo(QWidget):
 
     def _toggle_bold(self) -> None:
         """Toggle bold formatting."""
-        if self.bold_btn.isChecked():
-            self._set_format(700)  # Bold weight
-        else:
-            self._set_format(400)  # Normal weight
+        self._apply_format(_BOLD[self.bold_btn.isChecked()])
 
     def _toggle_italic(self) -> None:
         """Toggle italic formatting."""
-        format_obj = QTextCharFormat()
-        format_obj.setFontItalic(self.italic_btn.isChecked())
-        self._apply_format(format_obj)
+        self._apply_format(_ITALIC[self.italic_btn.isChecked()])
 
     def _toggle_underline(self) -> None:
         """Toggle underline formatting."""
-        format_obj = QTextCharFormat()
-        format_obj.setUnderlineStyle(
-            QTextCharFormat.UnderlineStyle.SingleUnderline
-            if self.underline_btn.isChecked()
-            else QTextCharFormat.UnderlineStyle.NoUnderline
-        )
-        self._apply_format(format_obj)
-
-    def _set_format(self, weight: int) -> None:
-        """Set font weight."""
-        format_obj = QTextCharFormat()
-        format_obj.setFontWeight(weight)
-        self._apply_format(format_obj)
+        self._apply_format(_UNDERLINE[self.underline_btn.isChecked()])
 
     def _apply_format(self, format_obj: QTextCharFormat) -> None:
-        """Apply format to current selection or at cursor."""
-        cursor = self.text_edit.textCursor()
-        if cursor.hasSelection():
-            cursor.mergeCharFormat(format_obj)
-        else:
-            format_obj.merge(cursor.charFormat())
-            cursor.setCharFormat(format_obj)
+        """Apply format to current selection, or to text typed at the cursor."""
+        # Merges into a copy, so the shared module formats are never modified
+        self.text_edit.mergeCurrentCharFormat(format_obj)
+        # The clicked button changed state on its own; resync on next move
+        self._last_fmt_state = None
         self.text_edit.setFocus()
 
     def _update_format_buttons(self) -> None:
-        """Update button states based on current formatting."""
-        cursor = self.text_edit.textCursor()
-        char_format = cursor.charFormat()
+        """Update button states based on current formatting.
+
+        Runs on every cursor move, so the buttons are only touched when the
+        format under the cursor actually differs from what they show.
+        """
+        char_format = self.text_edit.textCursor().charFormat()
 
         # FontWeight returns an int, Bold is typically 700
-        self.bold_btn.setChecked(char_format.fontWeight() >= 700)
-        self.italic_btn.setChecked(char_format.fontItalic())
-        is_underlined = char_format.underlineStyle() != QTextCharFormat.UnderlineStyle.NoUnderline
-        self.underline_btn.setChecked(is_underlined)
+        state = (
+            char_format.fontWeight() >= 700,
+            char_format.fontItalic(),
+            char_format.underlineStyle() != QTextCharFormat.UnderlineStyle.NoUnderline,
+        )
+        if state == self._last_fmt_state:
+            return
+        bold, italic, underlined = state
+        self.bold_btn.setChecked(bold)
+        self.italic_btn.setChecked(italic)
+        self.underline_btn.setChecked(underlined)
+        self._last_fmt_state = state
@@ -11,6 +11,34 @@ from PySide6.QtWidgets import QTreeView, QVBoxLayout, QWidget
 
 from ..core.ui_loader import load_ui
 
+# Tree node: (name, children); leaves are plain strings
+_TreeNode = tuple[str, tuple["_TreeNode | str", ...]]
+
+# Sample folder structure shown in the demo
+_SAMPLE_TREE: tuple[_TreeNode, ...] = (
+    (
+        "Projects",
+        (
+            ("Web App", ("src/main.py", "src/utils.py", "README.md")),
+            ("Desktop App", ("main_window.py", "dialogs.py")),
+        ),
+    ),
+    ("Documents", ("Notes.txt", "Todo.md")),
+)
+
+
+def _folder_item(name: str, children: tuple[_TreeNode | str, ...]) -> QStandardItem:
+    """Build a read-only folder item with its whole subtree attached."""
+    item = QStandardItem(name)
+    item.setEditable(False)
+    item.appendRows(
+        [
+            QStandardItem(child) if isinstance(child, str) else _folder_item(*child)
+            for child in children
+        ]
+    )
+    return item
+
 
 class TreeViewDemo(QWidget):
     """Demonstration of QTreeView with hierarchical data model."""
@@ -33,33 +61,11 @@ class TreeViewDemo(QWidget):
         self.model = QStandardItemModel(0, 1, self)
         self.model.setHeaderData(0, Qt.Orientation.Horizontal, "Name")
 
-        # Build hierarchical structure
+        # Build each top-level subtree detached from the model, then insert
+        # them with one appendRows, so the model emits a single rowsInserted
         root_item = self.model.invisibleRootItem()
+        root_item.appendRows([_folder_item(name, children) for name, children in _SAMPLE_TREE])
 
-        # Create sample folder structure
-        projects_item = QStandardItem("Projects")
-        projects_item.setEditable(False)
-        root_item.appendRow(projects_item)
-
-        project1 = QStandardItem("Web App")
-        project1.setEditable(False)
-        projects_item.appendRow(project1)
-        project1.appendRow(QStandardItem("src/main.py"))
-        project1.appendRow(QStandardItem("src/utils.py"))
-        project1.appendRow(QStandardItem("README.md"))
-
-        project2 = QStandardItem("Desktop App")
-        project2.setEditable(False)
-        projects_item.appendRow(project2)
-        project2.appendRow(QStandardItem("main_window.py"))
-        project2.appendRow(QStandardItem("dialogs.py"))
-
-        documents_item = QStandardItem("Documents")
-        documents_item.setEditable(False)
-        root_item.appendRow(documents_item)
-        documents_item.appendRow(QStandardItem("Notes.txt"))
-        documents_item.appendRow(QStandardItem("Todo.md"))
-
-        # Expand first level
+        # Attach the populated model and expand every level
         self.tree_view.setModel(self.model)
         self.tree_view.expandAll()
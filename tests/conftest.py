@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from PySide6.QtCore import QCoreApplication, QSettings
+
+from get_gphotos_data.core import settings as settings_module
+from get_gphotos_data.core.settings import Settings
+
+_INI = QSettings.Format.IniFormat
+_USER = QSettings.Scope.UserScope
+
+
+@pytest.fixture(autouse=True)
+def _isolated_qsettings(tmp_path, monkeypatch):
+    """Point every QSettings and settings snapshot at tmp_path, never the user's store.
+
+    QSettings has no getters for its default format or search path, so the
+    previous values are read back and restored after each test.
+    """
+    monkeypatch.setattr(settings_module, "app_data_dir", lambda: tmp_path / "data")
+    previous_format = QSettings.defaultFormat()
+    # <path>/<org>/<app>.ini -> <path>
+    previous_path = Path(QSettings(_INI, _USER, "org", "app").fileName()).parent.parent
+    previous_org = QCoreApplication.organizationName()
+    previous_app = QCoreApplication.applicationName()
+
+    QSettings.setDefaultFormat(_INI)
+    QSettings.setPath(_INI, _USER, str(tmp_path))
+    QCoreApplication.setOrganizationName("TestOrg")
+    QCoreApplication.setApplicationName("get-gphotos-data-tests")
+    yield
+    QCoreApplication.setApplicationName(previous_app)
+    QCoreApplication.setOrganizationName(previous_org)
+    QSettings.setPath(_INI, _USER, str(previous_path))
+    QSettings.setDefaultFormat(previous_format)
+
+
+@pytest.fixture
+def settings(qapp):
+    """Settings reset to defaults in the per-test INI store."""
+    s = Settings()
+    s.reset_to_defaults()
+    return s
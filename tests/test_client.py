@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime, timedelta
+
+import pytest
+import requests
+from google.oauth2.credentials import Credentials
+
+from get_gphotos_data.photos.client import _MAX_RETRY_AFTER, _RETRY, GooglePhotosClient
+
+
+def _credentials(token: str, lifetime: timedelta | None) -> Credentials:
+    expiry = None if lifetime is None else datetime.now(UTC).replace(tzinfo=None) + lifetime
+    return Credentials(token=token, expiry=expiry)
+
+
+def test_fresh_token_skips_auth_checks():
+    client = GooglePhotosClient(_credentials("first", timedelta(hours=1)))
+    assert client._auth_valid_until > time.monotonic()
+    client.credentials.token = "second"
+    client._update_session_auth()
+    assert client._auth_headers["Authorization"] == "Bearer first"
+
+
+def test_token_without_expiry_is_checked_every_time():
+    client = GooglePhotosClient(_credentials("first", None))
+    client.credentials.token = "second"
+    client._update_session_auth()
+    assert client._auth_headers["Authorization"] == "Bearer second"
+
+
+def test_request_parses_response_bytes(monkeypatch):
+    client = GooglePhotosClient(_credentials("t", timedelta(hours=1)))
+
+    def fake_request(session, **kwargs):
+        response = requests.Response()
+        response.status_code = 200
+        response._content = body
+        return response
+
+    monkeypatch.setattr(requests.Session, "request", fake_request)
+    body = b'{"albums": [{"id": "a"}]}'
+    assert client.list_albums() == {"albums": [{"id": "a"}]}
+    body = b"not json"
+    with pytest.raises(requests.RequestException):
+        client.list_albums()
+
+
+def test_concurrent_requests_do_not_share_a_session(monkeypatch):
+    client = GooglePhotosClient(_credentials("t", timedelta(hours=1)))
+    barrier = threading.Barrier(3)
+    used: list[tuple[requests.Session, str]] = []
+
+    def fake_request(session, **kwargs):
+        used.append((session, kwargs["headers"]["Authorization"]))
+        if len(used) <= 3:
+            barrier.wait(timeout=5)  # the first three requests are in flight at once
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b"{}"
+        return response
+
+    monkeypatch.setattr(requests.Session, "request", fake_request)
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        list(executor.map(lambda _: client.list_albums(), range(3)))
+    sessions = {id(session) for session, _ in used}
+    assert len(sessions) == 3
+    assert {header for _, header in used} == {"Bearer t"}
+
+    # Idle sessions are reused by later requests
+    client.list_albums()
+    assert id(used[-1][0]) in sessions
+
+
+def test_retry_after_is_capped():
+    response = requests.Response()
+    response.headers["Retry-After"] = "3600"
+    # Retry.new() (called after every attempt) must keep the cap
+    retry = _RETRY.new(total=2)
+    assert retry.get_retry_after(response) == _MAX_RETRY_AFTER
+    response.headers["Retry-After"] = "1"
+    assert retry.get_retry_after(response) == 1
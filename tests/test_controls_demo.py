@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+from get_gphotos_data.widgets.controls_demo import ControlsDemo
+
+
+def test_slider_updates_are_coalesced(qtbot):
+    demo = ControlsDemo()
+    qtbot.addWidget(demo)
+    for value in range(1, 20):
+        demo.slider.setValue(value)
+    assert demo._label_timer.isActive()
+    qtbot.waitUntil(lambda: not demo._label_timer.isActive())
+    assert demo.value_label.text() == f"Slider value: {demo.slider.value()}"
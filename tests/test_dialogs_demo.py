@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import xml.etree.ElementTree as ET
+from importlib.resources import files
+
+from PySide6.QtCore import QTimer
+from PySide6.QtWidgets import QApplication, QMessageBox, QWidget
+
+from get_gphotos_data.widgets.dialogs_demo import DialogsDemo
+
+
+def test_generated_ui_matches_ui_file(qtbot):
+    """_dialogs_demo_ui.py must be regenerated whenever dialogs_demo.ui changes."""
+    ui_file = files("get_gphotos_data.assets.ui").joinpath("dialogs_demo.ui")
+    root = ET.fromstring(ui_file.read_bytes())
+    names = {w.get("name") for w in root.iter("widget")} - {"DialogsDemo"}
+    demo = DialogsDemo()
+    qtbot.addWidget(demo)
+    demo.show()
+    for name in names:
+        assert demo.findChild(QWidget, name) is not None, name
+
+
+def test_ui_is_built_on_first_show(qtbot):
+    demo = DialogsDemo()
+    qtbot.addWidget(demo)
+    assert demo.findChild(QWidget, "color_button") is None
+    demo.show()
+    assert demo.ui.color_button.parent() is demo
+
+
+def test_message_boxes_are_reused(qtbot):
+    demo = DialogsDemo()
+    qtbot.addWidget(demo)
+    answers = []
+    for _ in range(2):
+        QTimer.singleShot(
+            0, lambda: QApplication.activeModalWidget().done(QMessageBox.StandardButton.Yes)
+        )
+        answers.append(demo._message(QMessageBox.Icon.Question, "Question", "Proceed?"))
+    assert answers == [QMessageBox.StandardButton.Yes] * 2
+    assert len(demo._boxes) == 1
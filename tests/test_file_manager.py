@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import os
+
+from get_gphotos_data.core.file_manager import FileManager
+from get_gphotos_data.core.settings import Settings
+
+
+def test_add_recent_file_skips_unchanged_write(settings, tmp_path, monkeypatch):
+    path = tmp_path / "a.txt"
+    path.write_text("x")
+    manager = FileManager(settings)
+    manager.add_recent_file(path)
+    assert settings.get_recent_files() == [str(path)]
+
+    writes: list[list[str]] = []
+    monkeypatch.setattr(Settings, "set_recent_files", lambda self, files: writes.append(files))
+    manager.add_recent_file(path)
+    assert writes == []
+
+
+def test_get_recent_files_drops_missing_and_duplicates(settings, tmp_path):
+    keep = tmp_path / "keep.txt"
+    keep.write_text("x")
+    settings.set_recent_files([str(keep), str(tmp_path / "gone.txt"), str(keep)])
+    manager = FileManager(settings)
+    assert manager.get_recent_files() == [keep]
+    assert settings.get_recent_files() == [str(keep)]
+
+
+def test_get_recent_files_merges_spellings_of_one_path(settings, tmp_path):
+    keep = tmp_path / "keep.txt"
+    keep.write_text("x")
+    settings.set_recent_files([f"{tmp_path}//keep.txt", str(keep), f"{tmp_path}/./keep.txt"])
+    assert FileManager(settings).get_recent_files() == [keep]
+    assert settings.get_recent_files() == [str(keep)]
+
+
+def test_get_recent_files_in_a_large_directory(settings, tmp_path):
+    for n in range(100):
+        (tmp_path / f"other{n}.txt").write_text("x")
+    recent = [tmp_path / "a.txt", tmp_path / "b.txt"]
+    for path in recent:
+        path.write_text("x")
+    settings.set_recent_files([str(path) for path in recent])
+    assert FileManager(settings).get_recent_files() == recent
+
+
+def test_get_recent_files_keeps_case_only_mismatches(settings, tmp_path, monkeypatch):
+    (tmp_path / "foo.json").write_text("x")
+    (tmp_path / "bar.json").write_text("x")
+    recent = [tmp_path / "Foo.json", tmp_path / "bar.json"]
+    settings.set_recent_files([str(path) for path in recent])
+    # Behave like a case-insensitive filesystem (macOS APFS, Windows NTFS)
+    names = {name.lower() for name in os.listdir(tmp_path)}
+    monkeypatch.setattr(os.path, "isfile", lambda p: os.path.basename(p).lower() in names)
+    assert FileManager(settings).get_recent_files() == recent
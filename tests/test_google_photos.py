@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from PySide6.QtCore import Qt
+
+from get_gphotos_data.widgets.google_photos import GooglePhotosView
+
+
+def _media_item(n: int) -> dict:
+    return {
+        "id": f"id-{n}",
+        "filename": f"IMG_{n:04d}.jpg",
+        "mimeType": "image/jpeg",
+        "mediaMetadata": {"creationTime": "2024-01-01T00:00:00Z", "width": "4", "height": "3"},
+    }
+
+
+def _column(view: GooglePhotosView, column: int) -> list[str]:
+    model = view.media_items_model
+    return [model.index(row, column).data() for row in range(model.rowCount())]
+
+
+def test_media_items_keep_the_users_sort_across_refreshes(qtbot):
+    view = GooglePhotosView()
+    qtbot.addWidget(view)
+    table = view.media_items_table
+    table.sortByColumn(1, Qt.SortOrder.AscendingOrder)  # as if the user clicked a header
+    view.media_items = [_media_item(n) for n in (3, 1, 2)]
+    view._populate_media_items_table()
+
+    assert _column(view, 0) == ["id-1", "id-2", "id-3"]
+    assert _column(view, 1) == ["IMG_0001.jpg", "IMG_0002.jpg", "IMG_0003.jpg"]
+    assert _column(view, 4) == ["4 × 3"] * 3
+
+
+def test_selection_follows_its_row_when_resorted(qtbot):
+    view = GooglePhotosView()
+    qtbot.addWidget(view)
+    view.media_items = [_media_item(n) for n in (3, 1, 2)]
+    view._populate_media_items_table()
+    table = view.media_items_table
+
+    table.selectRow(0)
+    qtbot.waitUntil(lambda: '"id": "id-3"' in view.details_text.toPlainText())
+    table.sortByColumn(0, Qt.SortOrder.AscendingOrder)
+    assert table.selectionModel().selectedRows()[0].row() == 2
+
+
+def test_selection_changes_are_coalesced(qtbot, monkeypatch):
+    view = GooglePhotosView()
+    qtbot.addWidget(view)
+    view.media_items = [_media_item(n) for n in range(5)]
+    view._populate_media_items_table()
+    shown = []
+    monkeypatch.setattr(view, "_show_item_details", lambda data, kind: shown.append(data["id"]))
+
+    for row in range(5):
+        view.media_items_table.selectRow(row)
+    qtbot.waitUntil(lambda: not view._selection_timer.isActive())
+    assert shown == ["id-4"]
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from get_gphotos_data.core.settings import Settings
+from get_gphotos_data.dialogs.preferences import PreferencesDialog
+
+
+def test_ui_is_built_on_first_show_and_reloaded(settings, qtbot):
+    dlg = PreferencesDialog(settings=settings)
+    qtbot.addWidget(dlg)
+    assert not dlg._built
+
+    dlg.show()
+    assert dlg._built
+    assert dlg.theme_combo.currentText() == "light"
+    dlg.theme_combo.setCurrentText("dark")
+    dlg.reject()
+
+    # A cancelled edit is discarded when the same instance is shown again
+    settings.set_max_recent_files(7)
+    dlg.show()
+    assert dlg.theme_combo.currentText() == "light"
+    assert dlg.max_recent_files_spin.value() == 7
+
+
+def test_accept_writes_only_changed_fields(settings, qtbot, monkeypatch):
+    dlg = PreferencesDialog(settings=settings)
+    qtbot.addWidget(dlg)
+    dlg.show()
+    validated: list[str] = []
+    monkeypatch.setattr(Settings, "validate_last_open_dir", lambda self, p: validated.append(p))
+
+    with qtbot.assertNotEmitted(dlg.theme_changed):
+        dlg.accept()
+    assert validated == []
+
+    dlg.show()
+    dlg.theme_combo.setCurrentText("dark")
+    with qtbot.waitSignal(dlg.theme_changed):
+        dlg.accept()
+    assert settings.get_theme() == "dark"
+    assert validated == []
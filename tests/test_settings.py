@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import threading
+
+from get_gphotos_data.core.settings import Settings, read_snapshot
+
+
+def test_getters_are_cached(settings):
+    settings.set_theme("dark")
+    # A write that bypasses the wrapper is not observed until the cache is reset
+    settings._qs.setValue(settings.keys.theme, "light")
+    assert settings.get_theme() == "dark"
+
+
+def test_unchanged_write_is_skipped(settings):
+    settings.set_theme("dark")
+    settings._qs.setValue(settings.keys.theme, "light")
+    # Same value as cached: the backing store is not touched
+    settings.set_theme("dark")
+    assert settings._qs.value(settings.keys.theme) == "light"
+    settings.invalidate()
+    assert settings.get_theme() == "light"
+
+
+def test_reset_clears_cache(settings):
+    settings.set_max_recent_files(5)
+    assert settings.get_max_recent_files() == 5
+    settings.reset_to_defaults()
+    assert settings.get_max_recent_files() == 10
+    assert settings.get_recent_files() == []
+
+
+def test_validate_last_open_dir(settings, tmp_path):
+    assert settings.validate_last_open_dir("")
+    assert settings.validate_last_open_dir(str(tmp_path))
+    assert not settings.validate_last_open_dir(str(tmp_path / "missing"))
+    assert settings.validate_theme("dark")
+    assert not settings.validate_theme("sepia")
+
+
+def test_snapshot_prepopulates_cache(settings):
+    settings.set_theme("dark")
+    warmed = Settings(snapshot=read_snapshot())
+    assert warmed._cache[warmed.keys.theme] == "dark"
+    assert warmed.get_theme() == "dark"
+
+
+def test_snapshot_round_trip(settings):
+    settings.set_theme("dark")
+    settings.set_window_geometry(b"\x01\xd9\xd0\xcb\x00")
+    settings.save_snapshot()
+    snapshot = read_snapshot()
+    assert snapshot[settings.keys.theme] == "dark"
+    assert snapshot[settings.keys.window_geometry] == b"\x01\xd9\xd0\xcb\x00"
+
+    # Any later write to the backing store invalidates the snapshot
+    settings.set_theme("light")
+    settings._qs.sync()
+    assert read_snapshot()[settings.keys.theme] == "light"
+
+
+def test_unsupported_values_are_left_out_of_the_snapshot(settings, monkeypatch, tmp_path):
+    settings.set_theme("dark")  # create the INI file the snapshot is stamped against
+    with monkeypatch.context() as m:
+        m.setattr(Settings, "_value", lambda self, key: threading.Lock())
+        settings.save_snapshot()
+    assert [p.name for p in (tmp_path / "data").iterdir()] == ["settings.json"]
+    # Keys missing from the snapshot are read from QSettings on demand
+    assert read_snapshot() == {}
+    assert Settings(snapshot=read_snapshot()).get_theme() == "dark"
+
+
+def test_damaged_snapshot_falls_back_to_qsettings(settings, tmp_path):
+    settings.set_theme("dark")
+    settings.save_snapshot()
+    snapshot_file = tmp_path / "data" / "settings.json"
+    snapshot_file.write_bytes(b"\x80\x05\x95garbage")
+
+    assert read_snapshot()[settings.keys.theme] == "dark"
+    assert not snapshot_file.exists()
+
+
+def test_batch_syncs_once_on_exit(settings, monkeypatch):
+    syncs: list[None] = []
+    monkeypatch.setattr(settings._qs, "sync", lambda: syncs.append(None))
+    with settings.batch():
+        settings.set_theme("dark")
+        with settings.batch():
+            settings.set_max_recent_files(3)
+        assert syncs == []
+    assert len(syncs) == 1
+
+
+def test_batch_can_defer_sync(settings, monkeypatch, qtbot):
+    syncs: list[None] = []
+    monkeypatch.setattr(settings._qs, "sync", lambda: syncs.append(None))
+    with settings.batch(defer_sync=True):
+        settings.set_theme("dark")
+    assert syncs == []
+    qtbot.waitUntil(lambda: len(syncs) == 1)
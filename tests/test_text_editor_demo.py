@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from PySide6.QtGui import QTextCursor
+
+from get_gphotos_data.widgets.text_editor_demo import _BOLD, TextEditorDemo
+
+
+def test_bold_toggle_applies_to_typed_text(qtbot):
+    demo = TextEditorDemo()
+    qtbot.addWidget(demo)
+    demo.text_edit.moveCursor(QTextCursor.MoveOperation.End)
+
+    demo.bold_btn.click()
+    demo.text_edit.insertPlainText("X")
+
+    assert demo.text_edit.textCursor().charFormat().fontWeight() == 700
+    assert _BOLD[True].fontWeight() == 700  # shared format left untouched
+    assert len(_BOLD[True].properties()) == 1
+
+
+def test_bold_toggle_applies_to_selection(qtbot):
+    demo = TextEditorDemo()
+    qtbot.addWidget(demo)
+    cursor = demo.text_edit.textCursor()
+    cursor.movePosition(QTextCursor.MoveOperation.End)
+    cursor.movePosition(QTextCursor.MoveOperation.StartOfBlock, QTextCursor.MoveMode.KeepAnchor)
+    demo.text_edit.setTextCursor(cursor)
+
+    demo.bold_btn.click()
+
+    assert demo.text_edit.textCursor().charFormat().fontWeight() == 700